@@ -0,0 +1,168 @@
+from pips_solver import GraphMultiProcess
+import argparse, json, os, platform, sys, time
+from multiprocessing import get_context
+
+try:
+    import resource
+except ImportError:  # Not available on Windows; peak RSS is then not recorded
+    resource = None
+
+"""
+Reproducible benchmark of the solver over every (date, difficulty) in boards_json.
+Each puzzle is solved on the sequential path, whose attempts are seeded from the attempt number and board
+size, in a fresh process so that peak RSS is per puzzle. Wall time, CPU time, nodes expanded and peak RSS
+are written to a JSON results file, answers are checked against the puzzle's 'solution' field, and a run can
+be compared per puzzle against an earlier results file used as the baseline.
+
+    python benchmark.py --engine backtrack --output results.json
+    python benchmark.py --baseline results.json    # exits with status 1 on a regression
+"""
+
+DIFFICULTIES = ['easy', 'medium', 'hard']
+
+
+def expected_values(board):
+    """Pip on every cell in the puzzle's published solution, where solution[i] holds dominoes[i]."""
+    values = {}
+    for (a, b), (p1, p2) in zip(board['dominoes'], board['solution']):
+        values[tuple(p1)] = int(a)
+        values[tuple(p2)] = int(b)
+    return values
+
+
+def is_valid(board, values):
+    """Check that values satisfies every region and uses exactly the pips of the dominoes."""
+    for region in board['regions']:
+        pips = [values.get(tuple(p)) for p in region['indices']]
+        if None in pips:
+            return False
+        region_type, target = region.get('type'), region.get('target')
+        if region_type == 'equals' and len(set(pips)) > 1:
+            return False
+        if region_type == 'unequal' and len(set(pips)) != len(pips):
+            return False
+        if target is not None and ((region_type == 'sum' and sum(pips) != target)
+                                   or (region_type == 'less' and not sum(pips) < target)
+                                   or (region_type == 'greater' and not sum(pips) > target)):
+            return False
+    return sorted(values.values()) == sorted(int(v) for domino in board['dominoes'] for v in domino)
+
+
+def _bench_job(job) -> dict:
+    file, difficulty, engine, timeout_limit = job
+    data = json.load(open(f'boards_json/{file}'))
+    board = data[difficulty]
+    game = GraphMultiProcess(data, difficulty)
+
+    wall, cpu = time.perf_counter(), time.process_time()
+    isSolved = game.solve(timeout=timeout_limit, use_parallel=False, engine=engine)
+    wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+
+    values = {node.p: node.value for node in game.nodes}
+    return {
+        'date': file[:-len('.json')],
+        'difficulty': difficulty,
+        'status': {True: 'solved', False: 'no_solution', None: 'timeout'}[isSolved],
+        'correct': isSolved is True and values == expected_values(board),
+        'valid': isSolved is True and is_valid(board, values),
+        'wall': round(wall, 4),
+        'cpu': round(cpu, 4),
+        **game.stats.as_dict(),
+        # ru_maxrss is in kilobytes on Linux
+        'peak_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource is not None else None,
+    }
+
+
+def run_benchmark(difficulties = DIFFICULTIES, timeout_limit = 15, engine: str = 'backtrack', processes = 1, dates = None) -> dict:
+    """Solve every (date, difficulty) pair, each in its own process, and return the results document.
+
+    Puzzles run one at a time by default so that their timings do not compete for cores.
+    """
+    files = sorted(f for f in os.listdir('boards_json') if f.endswith('.json'))
+    if dates:
+        files = [f for f in files if f[:-len('.json')] in dates]
+    jobs = [(file, difficulty, engine, timeout_limit) for file in files for difficulty in difficulties]
+
+    results = []
+    # A fresh interpreter per puzzle, so peak RSS and caches do not carry over between puzzles
+    with get_context('spawn').Pool(processes, maxtasksperchild=1) as pool:
+        for result in pool.imap(_bench_job, jobs):
+            results.append(result)
+            print(f'{result["date"]} {result["difficulty"]:<6} {result["status"]:<11} '
+                  f'wall {result["wall"]:.3f}s  cpu {result["cpu"]:.3f}s  nodes {result["nodes"]}'
+                  + ('' if result['valid'] or result['status'] != 'solved' else '  INVALID'))
+
+    return {
+        'engine': engine,
+        'timeout': timeout_limit,
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'results': results,
+    }
+
+
+def compare(results, baseline, tolerance = 0.25, min_delta = 0.05) -> list:
+    """Per-puzzle regressions of a results document against a baseline one.
+
+    A puzzle regresses if it is no longer solved, or if its wall time grew by more than tolerance
+    (relative) and min_delta seconds (absolute, to ignore noise on fast puzzles).
+
+    Returns:
+        List of human-readable regression messages, empty if there is none
+    """
+    previous = {(r['date'], r['difficulty']): r for r in baseline['results']}
+    regressions = []
+    for r in results['results']:
+        base = previous.get((r['date'], r['difficulty']))
+        if base is None:
+            continue
+        name = f'{r["date"]} {r["difficulty"]}'
+        if base['status'] == 'solved' and r['status'] != 'solved':
+            regressions.append(f'{name}: {r["status"]} (was solved)')
+        elif r['wall'] > base['wall'] * (1 + tolerance) and r['wall'] - base['wall'] > min_delta:
+            regressions.append(f'{name}: {r["wall"]:.3f}s (was {base["wall"]:.3f}s, '
+                               f'nodes {r["nodes"]} was {base["nodes"]})')
+    return regressions
+
+
+def main(argv = None) -> int:
+    parser = argparse.ArgumentParser(description='Benchmark the solver over boards_json.')
+    parser.add_argument('--engine', default='backtrack', choices=list(GraphMultiProcess.ENGINES))
+    parser.add_argument('--timeout', type=float, default=15)
+    parser.add_argument('--difficulties', default=','.join(DIFFICULTIES))
+    parser.add_argument('--dates', default=None, help='comma-separated dates, default: all')
+    parser.add_argument('--processes', type=int, default=1)
+    parser.add_argument('--output', default='benchmark_results.json')
+    parser.add_argument('--baseline', default=None, help='results file to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='allowed relative slowdown per puzzle')
+    args = parser.parse_args(argv)
+
+    results = run_benchmark(args.difficulties.split(','), args.timeout, args.engine, args.processes,
+                            args.dates.split(',') if args.dates else None)
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=1)
+
+    rows = results['results']
+    solved = [r for r in rows if r['status'] == 'solved']
+    invalid = [r for r in solved if not r['valid']]
+    print('------------------------')
+    print(f'Wall: {round(sum(r["wall"] for r in rows), 3)}s, CPU: {round(sum(r["cpu"] for r in rows), 3)}s, '
+          f'nodes: {sum(r["nodes"] for r in rows)}')
+    print(f'[✅] {len(solved)} / {len(rows)} solved, {sum(r["correct"] for r in rows)} matching the published solution')
+    print(f'[❌] {len(invalid)} / {len(rows)} invalid answers')
+    print(f'Results written to {args.output}')
+
+    failed = bool(invalid)
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for message in regressions:
+            print(f'[🐢] {message}')
+        print(f'{len(regressions)} regressions against {args.baseline}')
+        failed = failed or bool(regressions)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
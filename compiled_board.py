@@ -0,0 +1,67 @@
+from array import array
+
+"""
+Compact, array-backed form of a Pips board.
+Cells get integer ids in region order (the same order GraphMultiProcess builds its nodes in), neighbors are
+stored in CSR form and every per-cell or per-region field is a flat typed array. GraphMultiProcess builds the
+edges of its Node graph from it in O(cells) instead of comparing every pair of cells, and the bitboard and
+numba engines read its arrays directly. It is kept next to the Node graph, not in place of it: the
+pure-Python engines still walk Node objects and their neighbor lists.
+"""
+
+# Integer codes for region types, as stored in CompiledBoard.region_types
+REGION_TYPES = {'empty': 0, 'equals': 1, 'unequal': 2, 'less': 3, 'greater': 4, 'sum': 5}
+NO_TARGET = -1
+
+# Offsets of the 4 orthogonal neighbors of a cell
+NEIGHBOR_OFFSETS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+
+class CompiledBoard:
+    __slots__ = ('num_cells', 'rows', 'cols', 'index', 'neighbor_start', 'neighbor_ids',
+                 'cell_region', 'region_types', 'region_targets', 'region_start', 'region_cells')
+
+    def __init__(self, board):
+        """Build the compiled form in O(cells) from the 'regions' of one difficulty of a JSON puzzle."""
+        self.rows = array('i')
+        self.cols = array('i')
+        self.cell_region = array('i')
+        self.region_types = array('b')
+        self.region_targets = array('i')
+        self.region_start = array('i', [0])
+        self.region_cells = array('i')
+        self.index = {}  # (row, col) -> cell id
+
+        for r, region in enumerate(board['regions']):
+            self.region_types.append(REGION_TYPES.get(region.get('type'), 0))
+            target = region.get('target')
+            self.region_targets.append(NO_TARGET if target is None else target)
+            for row, col in region['indices']:
+                cell = len(self.rows)
+                self.index[(row, col)] = cell
+                self.rows.append(row)
+                self.cols.append(col)
+                self.cell_region.append(r)
+                self.region_cells.append(cell)
+            self.region_start.append(len(self.region_cells))
+        self.num_cells = len(self.rows)
+
+        # Neighbors found through the coordinate hash instead of comparing every pair of cells
+        self.neighbor_start = array('i', [0])
+        self.neighbor_ids = array('i')
+        for cell in range(self.num_cells):
+            row, col = self.rows[cell], self.cols[cell]
+            for dr, dc in NEIGHBOR_OFFSETS:
+                other = self.index.get((row + dr, col + dc))
+                if other is not None:
+                    self.neighbor_ids.append(other)
+            self.neighbor_start.append(len(self.neighbor_ids))
+
+    def __repr__(self) -> str:
+        return f"CompiledBoard(cells={self.num_cells}, regions={len(self.region_types)})"
+
+    def neighbors(self, cell):
+        return self.neighbor_ids[self.neighbor_start[cell]:self.neighbor_start[cell + 1]]
+
+    def region(self, r):
+        return self.region_cells[self.region_start[r]:self.region_start[r + 1]]
@@ -0,0 +1,134 @@
+"""
+Dancing-links exact-cover matrix and Knuth's Algorithm X.
+Used by GraphMultiProcess for the 'dlx' solving engine, where every cell and every domino is a column
+and every (domino, orientation, cell pair) placement is a row.
+"""
+
+class DancingLinks:
+
+    def __init__(self, num_columns, rows):
+        """Build the matrix from a list of rows, each a list of column indices in range(num_columns)."""
+        # Node 0 is the root header, nodes 1..num_columns are the column headers
+        self.num_columns = num_columns
+        self.L = list(range(-1, num_columns))
+        self.R = list(range(1, num_columns + 2))
+        self.L[0], self.R[num_columns] = num_columns, 0
+        self.U = list(range(num_columns + 1))
+        self.D = list(range(num_columns + 1))
+        self.C = list(range(num_columns + 1))
+        self.row_of = [-1] * (num_columns + 1)
+        self.size = [0] * (num_columns + 1)
+
+        for row_id, columns in enumerate(rows):
+            first = None
+            for col in columns:
+                c = col + 1
+                node = len(self.C)
+                self.C.append(c)
+                self.row_of.append(row_id)
+                # Insert at the bottom of column c
+                self.U.append(self.U[c])
+                self.D.append(c)
+                self.D[self.U[c]] = node
+                self.U[c] = node
+                self.size[c] += 1
+                # Link into the row's circular list
+                if first is None:
+                    first = node
+                    self.L.append(node)
+                    self.R.append(node)
+                else:
+                    self.L.append(self.L[first])
+                    self.R.append(first)
+                    self.R[self.L[first]] = node
+                    self.L[first] = node
+
+    def cover(self, c):
+        L, R, U, D, C, size = self.L, self.R, self.U, self.D, self.C, self.size
+        R[L[c]] = R[c]
+        L[R[c]] = L[c]
+        i = D[c]
+        while i != c:
+            j = R[i]
+            while j != i:
+                D[U[j]] = D[j]
+                U[D[j]] = U[j]
+                size[C[j]] -= 1
+                j = R[j]
+            i = D[i]
+
+    def uncover(self, c):
+        L, R, U, D, C, size = self.L, self.R, self.U, self.D, self.C, self.size
+        i = U[c]
+        while i != c:
+            j = L[i]
+            while j != i:
+                size[C[j]] += 1
+                D[U[j]] = j
+                U[D[j]] = j
+                j = L[j]
+            i = U[i]
+        R[L[c]] = c
+        L[R[c]] = c
+
+    def is_covered(self, col):
+        """Check if column col has been removed from the header list."""
+        c = col + 1
+        return self.R[self.L[c]] != c
+
+    def search(self, select, deselect, should_stop, choosable=None):
+        """Run Algorithm X, choosing the uncovered column with the fewest rows first.
+
+        Args:
+            select: Called with a row id before the row is taken; returns False to reject it
+            deselect: Called with a row id when a taken row is undone
+            should_stop: Called once per search node; returns True to abandon the search
+            choosable: Optional predicate on column indices that may be branched on
+
+        Returns:
+            List of row ids forming an exact cover, or None if none was found
+        """
+        L, R, D, C, size, row_of = self.L, self.R, self.D, self.C, self.size, self.row_of
+        solution = []
+
+        def recurse():
+            if R[0] == 0:
+                return True
+            if should_stop():
+                return False
+
+            # Column-size heuristic
+            best, best_size = None, None
+            c = R[0]
+            while c != 0:
+                if (best_size is None or size[c] < best_size) and (choosable is None or choosable(c - 1)):
+                    best, best_size = c, size[c]
+                    if best_size <= 1:
+                        break
+                c = R[c]
+            if best is None or best_size == 0:
+                return False
+
+            self.cover(best)
+            r = D[best]
+            while r != best:
+                row = row_of[r]
+                if select(row):
+                    solution.append(row)
+                    j = R[r]
+                    while j != r:
+                        self.cover(C[j])
+                        j = R[j]
+                    if recurse():
+                        return True
+                    j = L[r]
+                    while j != r:
+                        self.uncover(C[j])
+                        j = L[j]
+                    solution.pop()
+                    deselect(row)
+                r = D[r]
+            self.uncover(best)
+            return False
+
+        return solution if recurse() else None
@@ -0,0 +1,367 @@
+from compiled_board import REGION_TYPES, NO_TARGET
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit
+    jit = njit(cache=True)
+except ImportError:  # The kernel still imports, GraphMultiProcess uses the 'iterative' engine instead
+    njit = None
+
+    def jit(func):
+        return func
+
+"""
+Compiled CPU search kernel for the 'numba' engine of GraphMultiProcess.
+It runs the same explicit-stack search as the 'iterative' engine, but on flat NumPy integer arrays built
+from the compiled board, so numba can compile it in nopython mode. The kernel searches for a bounded number
+of steps per call and keeps all of its state in arrays, letting the caller check the timeout and
+cancellation between calls.
+"""
+
+# True when the kernel can run compiled; without numba or NumPy the engine falls back to 'iterative'
+AVAILABLE = njit is not None and np is not None
+
+EQUALS, UNEQUAL, LESS, GREATER = (REGION_TYPES[t] for t in ('equals', 'unequal', 'less', 'greater'))
+
+# Results of _search
+EXHAUSTED, SOLVED, PAUSED = 0, 1, 2
+
+# Slots of the counters array in the search state
+FRAMES, TRAIL, CANDIDATES, REMAINING, STEPS = 0, 1, 2, 3, 4
+
+# Search steps per kernel call between timeout checks
+STEP_BUDGET = 20000
+
+
+def compile_board(graph):
+    """Flatten a GraphMultiProcess into the tuple of arrays the kernel reads.
+
+    Returns:
+        (neighbor_start, neighbor_ids, cell_region, region_types, region_targets, region_sizes,
+        bounded_regions, edge_table, cell_kinds, kind_pips) where edge_table[e, k, o] says if kind
+        k in orientation o fits the cells of CSR edge e, cell_kinds[i, k] if kind k fits cell i at
+        all, and kind_pips[k] is the (low, high) pair of kind k
+    """
+    board = graph.board
+    domino_kinds, neighbor_tables, cell_kinds = graph._compile_feasibility()
+    num_kinds = len(domino_kinds)
+
+    region_start = np.array(board.region_start, dtype=np.int64)
+    region_types = np.array(board.region_types, dtype=np.int64)
+    region_targets = np.array(board.region_targets, dtype=np.int64)
+    bounded = (region_types >= LESS) & (region_targets != NO_TARGET)
+
+    edge_table = np.zeros((len(board.neighbor_ids), num_kinds, 2), dtype=np.bool_)
+    edge_rows = [table for tables in neighbor_tables for table in tables]
+    if edge_rows and num_kinds:
+        edge_table[:] = edge_rows
+    kind_table = np.zeros((board.num_cells, num_kinds), dtype=np.bool_)
+    for cell, kinds in enumerate(cell_kinds):
+        kind_table[cell, kinds] = True
+
+    return (np.array(board.neighbor_start, dtype=np.int64), np.array(board.neighbor_ids, dtype=np.int64),
+            np.array(board.cell_region, dtype=np.int64), region_types, region_targets,
+            np.diff(region_start), np.flatnonzero(bounded).astype(np.int64), edge_table, kind_table,
+            np.array(domino_kinds, dtype=np.int64).reshape(num_kinds, 2))
+
+
+def new_state(board, dominoes):
+    """Empty search state for a compiled board and its list of [a, b] dominoes."""
+    neighbor_start, _, _, region_types, _, _, _, _, _, kind_pips = board
+    num_cells = len(neighbor_start) - 1
+    num_kinds = len(kind_pips)
+    kind_index = {(int(lo), int(hi)): k for k, (lo, hi) in enumerate(kind_pips)}
+
+    domino_counts = np.zeros(num_kinds, dtype=np.int64)
+    pip_counts = np.zeros(7, dtype=np.int64)
+    for domino in dominoes:
+        v1, v2 = int(domino[0]), int(domino[1])
+        domino_counts[kind_index[(min(v1, v2), max(v1, v2))]] += 1
+        pip_counts[v1] += 1
+        pip_counts[v2] += 1
+
+    # One frame per placed domino plus the one that finds no empty cell, each with at most 8 candidates per kind
+    max_frames = num_cells // 2 + 1
+    counters = np.zeros(5, dtype=np.int64)
+    counters[REMAINING] = len(dominoes)
+    return (np.full(num_cells, -1, dtype=np.int64), np.diff(neighbor_start),
+            np.zeros(len(region_types), dtype=np.int64), np.zeros(len(region_types), dtype=np.int64),
+            np.zeros((len(region_types), 7), dtype=np.int64), domino_counts, pip_counts,
+            np.zeros(max_frames * 8 * max(num_kinds, 1), dtype=np.int64),
+            np.zeros((max_frames, 3), dtype=np.int64), np.zeros((max_frames, 3), dtype=np.int64), counters)
+
+
+def solve(graph, seed, should_stop):
+    """Run one randomly ordered search of the kernel on graph.
+
+    Args:
+        graph: GraphMultiProcess to solve
+        seed: Seed for the kernel's random candidate order
+        should_stop: Called between kernel calls; returns True to abandon the search
+
+    Returns:
+        (result, values, steps) where result is True, False or None (stopped), values holds the
+        pip of every cell when solved and steps counts the search steps taken
+    """
+    board = compile_board(graph)
+    state = new_state(board, graph.dominoes)
+    _seed(seed)
+    status = _start(board, state)
+    while status == PAUSED:
+        if should_stop():
+            return None, None, int(state[10][STEPS])
+        status = _search(board, state, STEP_BUDGET)
+    if status == SOLVED:
+        return True, state[0].tolist(), int(state[10][STEPS])
+    return False, None, int(state[10][STEPS])
+
+
+@jit
+def _seed(seed):
+    np.random.seed(seed)
+
+
+@jit
+def _check(board, state, cell, value):
+    """Check if placing value on cell keeps its region satisfiable, in O(1)."""
+    _, _, cell_region, region_types, region_targets, region_sizes, _, _, _, _ = board
+    region_filled, region_sums, region_counts = state[2], state[3], state[4]
+    r = cell_region[cell]
+    region_type = region_types[r]
+    filled = region_filled[r]
+    if region_type == EQUALS:
+        return region_counts[r, value] == filled
+    if region_type == UNEQUAL:
+        return region_counts[r, value] == 0
+    target = region_targets[r]
+    if region_type < LESS or target == NO_TARGET:
+        return True
+    total = region_sums[r] + value
+    if region_type == LESS:
+        return total < target
+    is_full = filled + 1 == region_sizes[r]
+    if region_type == GREATER:
+        return not is_full or total > target
+    return total <= target and (not is_full or total == target)
+
+
+@jit
+def _set_value(board, state, cell, value, delta):
+    """Place value on cell when delta is 1, remove it again when delta is -1."""
+    neighbor_start, neighbor_ids, cell_region = board[0], board[1], board[2]
+    values, empty_neighbors, region_filled, region_sums, region_counts, _, pip_counts = state[:7]
+    r = cell_region[cell]
+    values[cell] = value if delta > 0 else -1
+    region_filled[r] += delta
+    region_sums[r] += delta * value
+    region_counts[r, value] += delta
+    pip_counts[value] -= delta
+    for e in range(neighbor_start[cell], neighbor_start[cell + 1]):
+        empty_neighbors[neighbor_ids[e]] -= delta
+
+
+@jit
+def _has_dead_end(board, state, cell):
+    """Check if filling cell isolated one of its empty neighbors."""
+    neighbor_start, neighbor_ids = board[0], board[1]
+    values, empty_neighbors = state[0], state[1]
+    for e in range(neighbor_start[cell], neighbor_start[cell + 1]):
+        n = neighbor_ids[e]
+        if values[n] < 0 and empty_neighbors[n] == 0:
+            return True
+    return False
+
+
+@jit
+def _bounds_feasible(board, state):
+    """Check that every unfinished sum/less/greater region can still reach its target."""
+    region_types, region_targets, region_sizes, bounded_regions = board[3], board[4], board[5], board[6]
+    region_filled, region_sums, pip_counts = state[2], state[3], state[6]
+    for r in bounded_regions:
+        need = region_sizes[r] - region_filled[r]
+        if need == 0:
+            continue
+        low = high = region_sums[r]
+        k = need
+        for v in range(7):
+            take = min(k, pip_counts[v])
+            low += take * v
+            k -= take
+            if k == 0:
+                break
+        k = need
+        for v in range(6, -1, -1):
+            take = min(k, pip_counts[v])
+            high += take * v
+            k -= take
+            if k == 0:
+                break
+        target = region_targets[r]
+        if region_types[r] == LESS:
+            if low >= target:
+                return False
+        elif region_types[r] == GREATER:
+            if high <= target:
+                return False
+        elif not low <= target <= high:
+            return False
+    return True
+
+
+@jit
+def _find_next_empty(state):
+    """Find the empty cell with the fewest empty neighbors (MRV), or -1 if the board is full."""
+    values, empty_neighbors = state[0], state[1]
+    best_cell, min_empty_neighbors = -1, 5
+    for cell in range(len(values)):
+        if values[cell] < 0 and empty_neighbors[cell] < min_empty_neighbors:
+            best_cell, min_empty_neighbors = cell, empty_neighbors[cell]
+            if min_empty_neighbors <= 1:
+                break
+    return best_cell
+
+
+@jit
+def _push_frame(board, state, cell):
+    """Open a frame for cell and append its candidates in search order."""
+    neighbor_start, neighbor_ids, edge_table, cell_kinds = board[0], board[1], board[7], board[8]
+    values, empty_neighbors, domino_counts = state[0], state[1], state[5]
+    candidates, frames, counters = state[7], state[8], state[10]
+    num_kinds = edge_table.shape[1]
+
+    # Empty neighbors, most constrained first
+    edges = np.empty(4, dtype=np.int64)
+    num_edges = 0
+    for e in range(neighbor_start[cell], neighbor_start[cell + 1]):
+        if values[neighbor_ids[e]] < 0:
+            j = num_edges
+            while j > 0 and empty_neighbors[neighbor_ids[edges[j - 1]]] > empty_neighbors[neighbor_ids[e]]:
+                edges[j] = edges[j - 1]
+                j -= 1
+            edges[j] = e
+            num_edges += 1
+
+    # Available kinds that fit this cell, in random order
+    kinds = np.empty(num_kinds, dtype=np.int64)
+    num_to_try = 0
+    for k in range(num_kinds):
+        if cell_kinds[cell, k] and domino_counts[k] > 0:
+            kinds[num_to_try] = k
+            num_to_try += 1
+    for j in range(num_to_try - 1, 0, -1):
+        swap = np.random.randint(0, j + 1)
+        kinds[j], kinds[swap] = kinds[swap], kinds[j]
+
+    top = counters[FRAMES]
+    frames[top, 0] = cell
+    frames[top, 1] = counters[CANDIDATES]
+    frames[top, 2] = counters[CANDIDATES]
+    counters[FRAMES] += 1
+    c = counters[CANDIDATES]
+    for j in range(num_to_try):
+        k = kinds[j]
+        for o in range(2):
+            for i in range(num_edges):
+                e = edges[i]
+                if edge_table[e, k, o]:
+                    candidates[c] = (e * num_kinds + k) * 2 + o
+                    c += 1
+    counters[CANDIDATES] = c
+
+
+@jit
+def _try_place(board, state, cell, code):
+    """Make the placement a candidate code stands for; False with nothing placed if it fails."""
+    neighbor_ids, edge_table, kind_pips = board[1], board[7], board[9]
+    domino_counts, trail, counters = state[5], state[9], state[10]
+    num_kinds = edge_table.shape[1]
+    e = code // (num_kinds * 2)
+    k = code // 2 % num_kinds
+    neighbor = neighbor_ids[e]
+    if code % 2 == 0:
+        v1, v2 = kind_pips[k, 0], kind_pips[k, 1]
+    else:
+        v1, v2 = kind_pips[k, 1], kind_pips[k, 0]
+    if not _check(board, state, cell, v1):
+        return False
+    _set_value(board, state, cell, v1, 1)
+    if not _check(board, state, neighbor, v2):
+        _set_value(board, state, cell, v1, -1)
+        return False
+    _set_value(board, state, neighbor, v2, 1)
+    domino_counts[k] -= 1
+    if _has_dead_end(board, state, cell) or _has_dead_end(board, state, neighbor) or not _bounds_feasible(board, state):
+        domino_counts[k] += 1
+        _set_value(board, state, neighbor, v2, -1)
+        _set_value(board, state, cell, v1, -1)
+        return False
+    t = counters[TRAIL]
+    trail[t, 0] = cell
+    trail[t, 1] = neighbor
+    trail[t, 2] = k
+    counters[TRAIL] += 1
+    counters[REMAINING] -= 1
+    return True
+
+
+@jit
+def _undo_placement(board, state):
+    values, domino_counts, trail, counters = state[0], state[5], state[9], state[10]
+    counters[TRAIL] -= 1
+    t = counters[TRAIL]
+    cell, neighbor, k = trail[t, 0], trail[t, 1], trail[t, 2]
+    domino_counts[k] += 1
+    counters[REMAINING] += 1
+    _set_value(board, state, neighbor, values[neighbor], -1)
+    _set_value(board, state, cell, values[cell], -1)
+
+
+@jit
+def _start(board, state):
+    """Check the empty board and open the root frame."""
+    empty_neighbors, counters = state[1], state[10]
+    for cell in range(len(empty_neighbors)):
+        if empty_neighbors[cell] == 0:
+            return EXHAUSTED
+    if not _bounds_feasible(board, state):
+        return EXHAUSTED
+    cell = _find_next_empty(state)
+    if cell < 0:
+        return SOLVED if counters[REMAINING] == 0 else EXHAUSTED
+    _push_frame(board, state, cell)
+    return PAUSED
+
+
+@jit
+def _search(board, state, budget):
+    """Advance the search by up to budget steps, returning EXHAUSTED, SOLVED or PAUSED."""
+    candidates, frames, counters = state[7], state[8], state[10]
+    for _ in range(budget):
+        counters[STEPS] += 1
+        top = counters[FRAMES] - 1
+        if top < 0:
+            return EXHAUSTED
+        if counters[TRAIL] > top:
+            # Back at this frame after its last placement failed below it
+            _undo_placement(board, state)
+
+        cell, i, end = frames[top, 0], frames[top, 2], counters[CANDIDATES]
+        while i < end and not _try_place(board, state, cell, candidates[i]):
+            i += 1
+        if i == end:
+            counters[CANDIDATES] = frames[top, 1]
+            counters[FRAMES] -= 1
+            continue
+        frames[top, 2] = i + 1
+
+        cell = _find_next_empty(state)
+        if cell < 0:
+            if counters[REMAINING] == 0:
+                return SOLVED
+            continue
+        _push_frame(board, state, cell)
+    return PAUSED
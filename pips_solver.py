@@ -1,5 +1,15 @@
-import json, sys, time, random
-from multiprocessing import Process, Queue, cpu_count
+import argparse, json, time, random, queue, cProfile, pstats
+from collections import Counter, OrderedDict
+from multiprocessing import Event, Pipe, Process, Queue, Value, cpu_count
+from multiprocessing.connection import wait
+from dlx import DancingLinks
+from compiled_board import CompiledBoard
+from shared_nogoods import SharedNogoods
+
+try:
+    import numpy as np
+except ImportError:  # Feasibility tables fall back to plain Python loops
+    np = None
 
 """
 Attempt to construct and solve boards from the provided JSON files.
@@ -7,15 +17,149 @@ Compared to pips2.py, this version uses multiprocessing to attempt multiple deep
 This SIGNIFICANTLY improves the solve rate for hard puzzles, and what allows it to use as much time as needed for medium puzzles.
 """
 
+class SolveStats:
+    """Search statistics of a solve() call, filled in by every attempt and merged across workers."""
+
+    # Reasons a placement is rejected, as keys of prunes
+    PRUNE_REASONS = ('constraint', 'dead_end', 'tiling', 'bounds', 'propagation', 'transposition', 'shared_nogood')
+
+    __slots__ = ('nodes', 'placements', 'prunes', 'max_depth', 'restarts', 'backjumps', 'time_to_solution', 'worker')
+
+    def __init__(self):
+        self.nodes = 0  # Search nodes expanded (backtrack calls or the engine's equivalent)
+        self.placements = 0  # Domino placements tried
+        self.prunes = dict.fromkeys(self.PRUNE_REASONS, 0)
+        self.max_depth = 0  # Most dominoes placed at once
+        self.restarts = 0
+        self.backjumps = 0  # Levels left with untried candidates because their failure did not depend on them
+        self.time_to_solution = None  # Seconds from the start of solve() to the first solution
+        self.worker = None  # Attempt number (restarts) or worker index (split) that found the solution
+
+    def __repr__(self) -> str:
+        return f"SolveStats({', '.join(f'{name}={getattr(self, name)!r}' for name in self.__slots__)})"
+
+    def merge(self, other):
+        """Add the counts of other, e.g. the stats a worker reported back, to this object."""
+        self.nodes += other.nodes
+        self.placements += other.placements
+        for reason, count in other.prunes.items():
+            self.prunes[reason] += count
+        self.max_depth = max(self.max_depth, other.max_depth)
+        self.restarts += other.restarts
+        self.backjumps += other.backjumps
+
+    def as_dict(self):
+        """All counters as a plain, JSON-serializable dict, e.g. for benchmark results."""
+        stats = {name: getattr(self, name) for name in self.__slots__}
+        stats['prunes'] = dict(self.prunes)
+        return stats
+
+
+def _region_checks(regions, region_filled, region_sums, region_counts, pip_counts=None):
+    """Region constraint checks shared by the pure-Python engines.
+    
+    The closures read the engine's running aggregates in place: the cells filled in each region,
+    their pip sum, a histogram region_counts[r][v] of their pips, and pip_counts of the pips left
+    in the remaining dominoes (only needed by the bounds checks).
+    
+    Returns:
+        (check_constraints, region_bounds, bounds_feasible)
+    """
+    region_types = [region.get('type') for region in regions]
+    region_targets = [region.get('target') for region in regions]
+    region_sizes = [len(region['indices']) for region in regions]
+    bounded_regions = [r for r in range(len(regions))
+                       if region_types[r] in ('sum', 'less', 'greater') and region_targets[r] is not None]
+    
+    def check_constraints(r, value):
+        """Check if placing value in region r keeps the region satisfiable, in O(1)."""
+        region_type = region_types[r]
+        filled = region_filled[r]
+        if region_type == 'equals':
+            return region_counts[r][value] == filled
+        if region_type == 'unequal':
+            return not region_counts[r][value]
+        target = region_targets[r]
+        if target is None or region_type not in ('sum', 'less', 'greater'):
+            return True
+        total = region_sums[r] + value
+        if region_type == 'less':
+            return total < target
+        is_full = filled + 1 == region_sizes[r]
+        if region_type == 'greater':
+            return not is_full or total > target
+        return total <= target and (not is_full or total == target)
+    
+    def region_bounds(r):
+        """Minimum and maximum sum region r can still reach using the remaining pips."""
+        k = region_sizes[r] - region_filled[r]
+        low = high = region_sums[r]
+        need = k
+        for v in range(7):
+            take = min(need, pip_counts[v])
+            low += take * v
+            need -= take
+            if not need:
+                break
+        need = k
+        for v in range(6, -1, -1):
+            take = min(need, pip_counts[v])
+            high += take * v
+            need -= take
+            if not need:
+                break
+        return low, high
+    
+    def bounds_feasible():
+        """Check that every unfinished sum/less/greater region can still reach its target."""
+        for r in bounded_regions:
+            if region_filled[r] == region_sizes[r]:
+                continue
+            low, high = region_bounds(r)
+            target = region_targets[r]
+            region_type = region_types[r]
+            if region_type == 'sum':
+                if not low <= target <= high:
+                    return False
+            elif region_type == 'less':
+                if low >= target:
+                    return False
+            elif high <= target:
+                return False
+        return True
+    
+    return check_constraints, region_bounds, bounds_feasible
+
+
 class GraphMultiProcess:
 
+    # Maps each engine name accepted by solve() to the method that runs a single attempt
+    ENGINES = {'backtrack': '_solve_once', 'bitboard': '_solve_bitboard', 'dlx': '_solve_dlx',
+               'iterative': '_solve_iterative', 'numba': '_solve_numba'}
+    # Forward checks the backtrack engine can run after each placement
+    FORWARD_CHECKS = ('dead_end', 'tiling')
+    # Ways solve() can spread work across processes
+    PARALLEL_MODES = ('restarts', 'split')
+    # Restart policies for a single backtrack attempt
+    RESTART_POLICIES = (None, 'luby', 'geometric')
+    # Seed of the Zobrist keys that hash search states, fixed so every process computes the same hashes
+    ZOBRIST_SEED = 0x5EED
+    # Largest island of empty cells whose domino subsets the backtrack engine enumerates, and the
+    # search nodes it may spend on one before falling back to searching the board as a whole
+    ISLAND_CELLS = 12
+    ISLAND_NODES = 5000
+
     class Node:
+        __slots__ = ('p', 'type', 'target', 'neighbors', 'value', 'region', 'index')
+
         def __init__(self, point, _type = None, target = None):
-            self.p = point
+            self.p = tuple(point)
             self.type = _type
             self.target = target
             self.neighbors = []
             self.value = None
+            self.region = None  # Index of the node's region in the JSON definitions
+            self.index = None  # Position of the node in GraphMultiProcess.nodes
 
         def __repr__(self) -> str:
             return f"Node(point={self.p}, type={self.type}, target={self.target}, neighbors={[n.p for n in self.neighbors]})"
@@ -23,11 +167,35 @@ class GraphMultiProcess:
     def __init__(self, data, difficulty = 'easy'):
         self.nodes = []
         self.difficulty_data = data[difficulty]  # Store for region precomputation
+        self.board = CompiledBoard(self.difficulty_data)  # Integer ids, CSR neighbors and region arrays
         self.construct_nodes(data, difficulty)
         self.construct_edges()
         self.dominoes = data[difficulty]['dominoes']
         self.node_to_region = {}  # Cache: maps each node to its region
         self._precompute_regions()
+        self.engine = 'backtrack'
+        self.forward_check = 'dead_end'
+        self._feasibility = None  # Compiled lazily by _compile_feasibility()
+        self._zobrist = None  # Compiled lazily by _compile_zobrist()
+        self._dead_states = None  # Hashes of states proven to have no solution, oldest first
+        self.pool = None
+        self.parallel_mode = 'restarts'
+        self.workers = None
+        self.restarts = None
+        self.restart_base = 256
+        self.propagate = False
+        self.transpositions = 100000
+        self.share_nogoods = True
+        self.backjump = False
+        self.islands = False
+        self.forced = ()  # Placements found by presolve(), replayed ahead of every backtrack attempt
+        self.pairs = ()  # Cells presolve() found can only pair with each other, as (pos1, pos2)
+        self.shared_nogoods = None  # SharedNogoods table this attempt shares with the other workers of the puzzle
+        self.nogood_salt = 0  # XORed into hashes in shared_nogoods, to tell puzzles sharing one table apart
+        self.cancel_check = None  # Optional callable; a running attempt stops once it returns True
+        self.wants_work = None  # Optional callable; True when another worker has run out of subtrees
+        self.give_work = None  # Callable receiving the prefixes of subtrees handed to other workers
+        self.stats = SolveStats()  # Statistics of the current solve(), see solve(stats=...)
 
     def __repr__(self) -> str:
         res: str = ''
@@ -39,35 +207,178 @@ class GraphMultiProcess:
         for r in data[difficulty]['regions']:
             for i in r['indices']:
                 self.nodes.append(self.Node(i, (r['type'] if 'type' in r else None), (r['target'] if 'target' in r else None)))
+                self.nodes[-1].index = len(self.nodes) - 1
         return self.nodes
 
     def construct_edges(self):
-        # iterate through all nodes and add edges to neighbors
+        # link each node to its neighbors through the compiled board's CSR arrays (node i is cell i)
         for node in self.nodes:
-            for neighbor in self.nodes:
-                dx = abs(node.p[0] - neighbor.p[0])
-                dy = abs(node.p[1] - neighbor.p[1])
-                if (dx == 1 and dy == 0) or (dx == 0 and dy == 1):
-                    node.neighbors.append(neighbor)
+            node.neighbors = [self.nodes[j] for j in self.board.neighbors(node.index)]
         return self.nodes
     
     def _precompute_regions(self):
         """Pre-compute all regions once during initialization using JSON definitions."""
-        # Create a position-to-node mapping for quick lookup
-        pos_to_node = {tuple(node.p): node for node in self.nodes}
-        
-        # Use the explicit region definitions from the JSON
-        for region_def in self.difficulty_data['regions']:
-            # Get all nodes in this region
-            region_nodes = []
-            for pos in region_def['indices']:
-                pos_tuple = tuple(pos)
-                if pos_tuple in pos_to_node:
-                    region_nodes.append(pos_to_node[pos_tuple])
+        # Use the region membership recorded in the compiled board
+        for region_id in range(len(self.difficulty_data['regions'])):
+            region_nodes = [self.nodes[i] for i in self.board.region(region_id)]
             
             # Map each node in this region to the region list
             for node in region_nodes:
-                self.node_to_region[tuple(node.p)] = region_nodes
+                self.node_to_region[node.p] = region_nodes
+                node.region = region_id
+
+    def _compile_bitboard(self):
+        """Compile the graph into integer bitmasks, where bit i stands for self.nodes[i].
+
+        Returns:
+            (neighbor_masks, cell_region, region_masks, region_types, region_targets)
+        """
+        board = self.board
+        neighbor_masks = []
+        for cell in range(board.num_cells):
+            mask = 0
+            for n in board.neighbors(cell):
+                mask |= 1 << n
+            neighbor_masks.append(mask)
+
+        region_masks, region_types, region_targets = [], [], []
+        for r, region_def in enumerate(self.difficulty_data['regions']):
+            mask = 0
+            for cell in board.region(r):
+                mask |= 1 << cell
+            region_masks.append(mask)
+            region_types.append(region_def.get('type'))
+            region_targets.append(region_def.get('target'))
+        return neighbor_masks, list(board.cell_region), region_masks, region_types, region_targets
+
+    def _compile_feasibility(self):
+        """Precompute which domino placements are statically allowed, before any search.
+        
+        A placement is a domino kind (distinct (low, high) pair) in one of two orientations on a
+        node and one of its neighbors. It is ruled out by unary facts about each cell (pips that no
+        domino has, sum/less/greater caps and floors, single-cell targets, equals regions needing
+        more copies of a pip than exist) and, when both cells share a region, by that region's
+        constraint on the pair. Built as NumPy boolean tensors when NumPy is available.
+        
+        Returns:
+            (domino_kinds, neighbor_tables, cell_kinds) where neighbor_tables[i][j][k][o] says if
+            kind k in orientation o (0: low/high, 1: high/low) fits nodes[i] and its j-th neighbor,
+            and cell_kinds[i] lists the kinds that fit nodes[i] with any neighbor
+        """
+        if self._feasibility is not None:
+            return self._feasibility
+        
+        dominoes = [(int(d[0]), int(d[1])) for d in self.dominoes]
+        domino_kinds = sorted({tuple(sorted(d)) for d in dominoes})
+        pip_totals = [0] * 7
+        for v1, v2 in dominoes:
+            pip_totals[v1] += 1
+            pip_totals[v2] += 1
+        
+        regions = self.difficulty_data['regions']
+        region_sizes = [len(r['indices']) for r in regions]
+        
+        def value_allowed(node, v):
+            """Unary facts about a single cell."""
+            if not pip_totals[v]:
+                return False
+            k = region_sizes[node.region]
+            target = node.target
+            if node.type == 'sum' and target is not None:
+                return target - 6 * (k - 1) <= v <= target
+            if node.type == 'less' and target is not None:
+                return v < target
+            if node.type == 'greater' and target is not None:
+                return v > target - 6 * (k - 1)
+            if node.type == 'equals':
+                return pip_totals[v] >= k
+            if node.type == 'unequal':
+                return k <= sum(1 for count in pip_totals if count)
+            return True
+        
+        def pair_allowed(node, neighbor, v1, v2):
+            """Facts about two cells of the same region holding both halves of a domino."""
+            if node.region != neighbor.region:
+                return True
+            k = region_sizes[node.region]
+            target = node.target
+            total = v1 + v2
+            if node.type == 'sum' and target is not None:
+                return total <= target and (k > 2 or total == target)
+            if node.type == 'less' and target is not None:
+                return total < target
+            if node.type == 'greater' and target is not None:
+                return k > 2 or total > target
+            if node.type == 'equals':
+                return v1 == v2
+            if node.type == 'unequal':
+                return v1 != v2
+            return True
+        
+        allowed = [[value_allowed(node, v) for v in range(7)] for node in self.nodes]
+        edges = [(node, neighbor) for node in self.nodes for neighbor in node.neighbors]
+        
+        if np is not None and edges:
+            # Orientation 0 puts the kind's low pip on the node, orientation 1 the high pip
+            first = np.array([[lo, hi] for lo, hi in domino_kinds], dtype=np.intp)
+            second = first[:, ::-1]
+            cells_a = np.array([node.index for node, _ in edges], dtype=np.intp)
+            cells_b = np.array([neighbor.index for _, neighbor in edges], dtype=np.intp)
+            allowed_array = np.array(allowed, dtype=bool)
+            table = allowed_array[cells_a][:, first] & allowed_array[cells_b][:, second]
+            
+            same = np.array([node.region == neighbor.region for node, neighbor in edges])
+            if same.any():
+                pair = np.array([[[pair_allowed(node, neighbor, lo, hi), pair_allowed(node, neighbor, hi, lo)]
+                                  for lo, hi in domino_kinds] if node.region == neighbor.region else
+                                 [[True, True]] * len(domino_kinds) for node, neighbor in edges], dtype=bool)
+                table &= pair
+            
+            # A double has only one distinct orientation
+            doubles = np.array([lo == hi for lo, hi in domino_kinds])
+            table[:, doubles, 1] = False
+            rows = table.tolist()
+        else:
+            rows = [[[allowed[node.index][lo] and allowed[neighbor.index][hi] and pair_allowed(node, neighbor, lo, hi),
+                      lo != hi and allowed[node.index][hi] and allowed[neighbor.index][lo] and pair_allowed(node, neighbor, hi, lo)]
+                     for lo, hi in domino_kinds] for node, neighbor in edges]
+        
+        neighbor_tables = []
+        cell_kinds = []
+        e = 0
+        for node in self.nodes:
+            tables = rows[e:e + len(node.neighbors)]
+            e += len(node.neighbors)
+            neighbor_tables.append(tables)
+            cell_kinds.append([k for k in range(len(domino_kinds)) if any(t[k][0] or t[k][1] for t in tables)])
+        
+        self._feasibility = (domino_kinds, neighbor_tables, cell_kinds)
+        return self._feasibility
+
+    def _compile_zobrist(self):
+        """Random 64-bit Zobrist keys for hashing search states, the same in every process.
+        
+        Returns:
+            (cell_keys, sum_keys, value_keys, count_keys) where cell_keys[i] marks nodes[i] as filled,
+            sum_keys[r][s] and value_keys[r][v] stand for the running sum or a placed pip of an
+            unfinished region r, and count_keys[k][c] for c dominoes of kind k being left
+        """
+        if self._zobrist is not None:
+            return self._zobrist
+        
+        rng = random.Random(self.ZOBRIST_SEED)
+        regions = self.difficulty_data['regions']
+        domino_kinds, _, _ = self._compile_feasibility()
+        kind_totals = [0] * len(domino_kinds)
+        for domino in self.dominoes:
+            kind_totals[domino_kinds.index(tuple(sorted((int(domino[0]), int(domino[1])))))] += 1
+        
+        cell_keys = [rng.getrandbits(64) for _ in self.nodes]
+        sum_keys = [[rng.getrandbits(64) for _ in range(6 * len(region['indices']) + 1)] for region in regions]
+        value_keys = [[rng.getrandbits(64) for _ in range(7)] for _ in regions]
+        count_keys = [[rng.getrandbits(64) for _ in range(total + 1)] for total in kind_totals]
+        self._zobrist = (cell_keys, sum_keys, value_keys, count_keys)
+        return self._zobrist
 
     def visualize(self):
         visual_dict = {'unequal': '!', 'equals': '=', 'less': '<', 'greater': '>', 'empty': '_', 'sum': '+'}
@@ -113,100 +424,497 @@ class GraphMultiProcess:
 
 # ------------------------------------------------------------------------------------------------
 
-    def solve(self, timeout=60, max_attempts=7, use_parallel=True):
+    def presolve(self):
+        """Find the placements and pairings every solution contains, without any search.
+        
+        Narrows the pips each empty cell can take (single-cell and zero sum targets, sum and less
+        caps, pips already placed in equals and unequal regions, pips no remaining domino has) and
+        lists the ways each empty cell can still be covered. A cell left with a single way gets
+        that domino placed. A cell whose ways all use the same neighbor, such as a cell with one
+        empty neighbor, is paired with it even if its pips are still open, which rules out every
+        other pairing of the two cells. Repeats until nothing changes.
+        
+        Returns:
+            (forced, pairs) where forced lists the forced placements (pos1, pos2, value1, value2) in
+            the order they were found and pairs the (pos1, pos2) pairings of cells still empty,
+            or None if the board has no solution
+        """
+        nodes = self.nodes
+        regions = self.difficulty_data['regions']
+        domino_kinds, neighbor_tables, cell_kinds = self._compile_feasibility()
+        kind_index = {kind: k for k, kind in enumerate(domino_kinds)}
+        domino_counts = [0] * len(domino_kinds)
+        pip_counts = [0] * 7
+        for domino in self.dominoes:
+            v1, v2 = int(domino[0]), int(domino[1])
+            domino_counts[kind_index[tuple(sorted((v1, v2)))]] += 1
+            pip_counts[v1] += 1
+            pip_counts[v2] += 1
+        values = [None] * len(nodes)
+        partner = [None] * len(nodes)  # Index of the only cell each cell can still pair with
+        
+        # Running per-region aggregates, as in _solve_once
+        region_sizes = [len(r['indices']) for r in regions]
+        region_filled = [0] * len(regions)
+        region_sums = [0] * len(regions)
+        region_counts = [[0] * 7 for _ in regions]
+        
+        def set_value(i, value):
+            r = nodes[i].region
+            values[i] = value
+            region_filled[r] += 1
+            region_sums[r] += value
+            region_counts[r][value] += 1
+        
+        def clear_value(i):
+            r = nodes[i].region
+            region_filled[r] -= 1
+            region_sums[r] -= values[i]
+            region_counts[r][values[i]] -= 1
+            values[i] = None
+        
+        def domain(i):
+            """Pips nodes[i] can still take, as a 7-bit mask."""
+            node = nodes[i]
+            r = node.region
+            counts = region_counts[r]
+            mask = 0
+            for v in range(7):
+                if pip_counts[v]:
+                    mask |= 1 << v
+            if node.type == 'equals' and region_filled[r]:
+                mask &= 1 << counts.index(region_filled[r])
+            elif node.type == 'unequal':
+                for v in range(7):
+                    if counts[v]:
+                        mask &= ~(1 << v)
+            elif node.target is not None and node.type in ('sum', 'less'):
+                rest = node.target - region_sums[r] - (node.type == 'less')
+                if rest < 0:
+                    return 0
+                mask &= (1 << (min(rest, 6) + 1)) - 1
+                if node.type == 'sum':
+                    # The other empty cells of the region can make up at most 6 each
+                    mask &= ~((1 << max(rest - 6 * (region_sizes[r] - region_filled[r] - 1), 0)) - 1)
+            elif node.type == 'greater' and node.target is not None and region_filled[r] + 1 == region_sizes[r]:
+                mask &= ~((1 << max(node.target - region_sums[r] + 1, 0)) - 1)
+            return mask & 0x7f
+        
+        def options(i):
+            """(neighbor, value, neighbor value) placements that can still cover nodes[i].
+            
+            Stops early once two placements with different neighbors are found.
+            """
+            node = nodes[i]
+            mask = domain(i)
+            found = []
+            for neighbor, table in zip(node.neighbors, neighbor_tables[i]):
+                j = neighbor.index
+                if values[j] is not None or partner[i] not in (None, j) or partner[j] not in (None, i):
+                    continue
+                if neighbor.region == node.region:
+                    neighbor_masks = {}  # Domain of the neighbor once nodes[i] holds each pip
+                else:
+                    neighbor_mask = domain(j)
+                for k in cell_kinds[i]:
+                    if not domino_counts[k]:
+                        continue
+                    lo, hi = domino_kinds[k]
+                    for o, (v1, v2) in enumerate(((lo, hi), (hi, lo))):
+                        if (o and lo == hi) or not table[k][o] or not mask >> v1 & 1:
+                            continue
+                        if neighbor.region == node.region:
+                            if v1 not in neighbor_masks:
+                                set_value(i, v1)
+                                neighbor_masks[v1] = domain(j)
+                                clear_value(i)
+                            neighbor_mask = neighbor_masks[v1]
+                        if neighbor_mask >> v2 & 1:
+                            found.append((neighbor, v1, v2))
+                            if len(found) > 1 and found[0][0] is not neighbor:
+                                return found
+            return found
+        
+        forced = []
+        changed = True
+        while changed:
+            changed = False
+            for node in nodes:
+                i = node.index
+                if values[i] is not None:
+                    continue
+                found = options(i)
+                if not found:
+                    return None
+                neighbor = found[0][0]
+                if len(found) == 1:
+                    _, v1, v2 = found[0]
+                    set_value(i, v1)
+                    set_value(neighbor.index, v2)
+                    domino_counts[kind_index[tuple(sorted((v1, v2)))]] -= 1
+                    pip_counts[v1] -= 1
+                    pip_counts[v2] -= 1
+                    forced.append((node.p, neighbor.p, v1, v2))
+                    changed = True
+                elif partner[i] is None and all(n is neighbor for n, _, _ in found):
+                    partner[i], partner[neighbor.index] = neighbor.index, i
+                    changed = True
+        pairs = [(node.p, nodes[partner[node.index]].p) for node in nodes
+                 if values[node.index] is None and partner[node.index] is not None and partner[node.index] > node.index]
+        return forced, pairs
+
+    def solve(self, timeout=60, max_attempts=7, use_parallel=True, engine='backtrack', forward_check='dead_end',
+              pool=None, parallel_mode='restarts', workers=None, restarts=None, restart_base=256, cache=None,
+              propagate=False, stats=None, transpositions=100000,
+              share_nogoods=True, backjump=False, islands=False, presolve=None):
         """Solve the puzzle by placing dominoes on the graph.
         
         Args:
             timeout: Maximum time in seconds to attempt solving (default: 60)
             max_attempts: Number of random attempts to try (default: 7)
             use_parallel: Use parallel processing for attempts (default: True)
+            engine: Search engine to use, one of ENGINES (default: 'backtrack')
+            forward_check: 'dead_end' rejects placements that isolate an empty cell, 'tiling'
+                rejects placements after which the empty cells can no longer be tiled by
+                dominoes (backtrack engine only, default: 'dead_end')
+            pool: SolverPool whose long-lived workers run the parallel attempts, instead of
+                starting new processes for this puzzle (restarts mode only, default: None)
+            parallel_mode: 'restarts' runs differently seeded attempts of the whole search in
+                parallel, 'split' divides the search tree into disjoint subtrees shared out to
+                the workers (backtrack engine only, default: 'restarts')
+            workers: Number of worker processes (default: min(max_attempts, cpu_count(), 4) for
+                restarts, cpu_count() for split)
+            restarts: Restart policy inside each backtrack attempt: None, 'luby' or 'geometric'.
+                Each run is cut off after a number of backtrack calls and the search starts over
+                with a fresh random domino order (default: None)
+            restart_base: Backtrack calls allowed in the first run of a restart policy (default: 256)
+            cache: SolutionCache checked before searching and updated after a successful solve,
+                matching boards up to translation, rotation and reflection (default: None)
+            propagate: Keep a domain of possible pips per cell and re-run arc consistency (AC-3)
+                over region constraints and domino availability after every placement
+                (backtrack engine only, default: False)
+            stats: SolveStats to fill with search statistics, including those reported by parallel
+                workers; a new one is kept in self.stats otherwise (default: None)
+            transpositions: Size of the LRU table of states proven to have no solution, keyed by a
+                Zobrist hash of the filled cells, the aggregates of unfinished regions and the
+                remaining dominoes, so a state reached again by another placement order is not
+                searched twice; 0 disables it (backtrack engine only, default: 100000)
+            share_nogoods: With parallel workers and transpositions, also publish dead states to
+                a lock-free table in shared memory that every worker of the puzzle checks before
+                expanding a state (default: True)
+            backjump: Conflict-directed backjumping: every failure records the placements it depends
+                on, through region membership and domino usage, and the search returns straight to
+                the most recent of them instead of the previous placement (backtrack engine only,
+                default: False)
+            islands: Once the empty cells split into islands that share no neighbor and no region,
+                fill the smallest island first with one arrangement per distinct set of dominoes
+                it can take, so a failure elsewhere does not retry its other arrangements
+                (backtrack engine only, default: False)
+            presolve: Run presolve() first. A board it fills completely is solved without any
+                search, otherwise the backtrack engine starts every attempt from its forced
+                placements and only pairs cells as it paired them (default: None, which runs it
+                with the backtrack engine only, as the other engines do not use its results)
             
         Returns:
             True if solved, False if failed, None if timeout
         """
-        if use_parallel and max_attempts > 1:
-            return self._solve_parallel(timeout, max_attempts)
+        if engine not in self.ENGINES:
+            raise ValueError(f"Unknown engine '{engine}', expected one of {list(self.ENGINES)}")
+        if forward_check not in self.FORWARD_CHECKS:
+            raise ValueError(f"Unknown forward check '{forward_check}', expected one of {list(self.FORWARD_CHECKS)}")
+        if parallel_mode not in self.PARALLEL_MODES:
+            raise ValueError(f"Unknown parallel mode '{parallel_mode}', expected one of {list(self.PARALLEL_MODES)}")
+        if parallel_mode == 'split' and engine != 'backtrack':
+            raise ValueError("parallel_mode='split' requires engine='backtrack'")
+        if restarts not in self.RESTART_POLICIES:
+            raise ValueError(f"Unknown restart policy '{restarts}', expected one of {list(self.RESTART_POLICIES)}")
+        self.engine = engine
+        self.forward_check = forward_check
+        self.pool = pool
+        self.parallel_mode = parallel_mode
+        self.workers = workers
+        self.restarts = restarts
+        self.restart_base = restart_base
+        self.propagate = propagate
+        self.transpositions = transpositions
+        self.share_nogoods = share_nogoods
+        self.backjump = backjump
+        self.islands = islands
+        self._dead_states = None
+        self.stats = stats if stats is not None else SolveStats()
+        start_time = time.time()
+
+        regions = self.difficulty_data['regions']
+        if cache is not None:
+            solution = cache.get(regions, self.dominoes)
+            if solution is not None:
+                self._apply_solution(solution)
+                self.stats.time_to_solution = time.time() - start_time
+                return True
+
+        if presolve is None:
+            presolve = engine == 'backtrack'
+        presolved = self.presolve() if presolve else ([], [])
+        forced, pairs = presolved or ((), ())
+        self.forced, self.pairs = tuple(forced), tuple(pairs)
+        if presolved is None:
+            result = False
+        elif forced and 2 * len(forced) == len(self.nodes) and len(forced) == len(self.dominoes):
+            self._apply_solution({pos: value for pos1, pos2, v1, v2 in forced for pos, value in ((pos1, v1), (pos2, v2))})
+            result = True
+        elif use_parallel and parallel_mode == 'split':
+            result = self._solve_split(timeout, workers or cpu_count())
+        elif use_parallel and max_attempts > 1:
+            result = self._solve_parallel(timeout, max_attempts)
         else:
-            return self._solve_sequential(timeout, max_attempts)
+            result = self._solve_sequential(timeout, max_attempts)
+
+        if result is True:
+            self.stats.time_to_solution = time.time() - start_time
+            if cache is not None:
+                cache.put(regions, self.dominoes, {node.p: node.value for node in self.nodes})
+        return result
     
     def _apply_solution(self, solution):
         """Apply a solution dictionary to the graph nodes."""
         for node in self.nodes:
-            key = tuple(node.p)
+            key = node.p
             if key in solution:
                 node.value = solution[key]
+
+    def _run_engine(self, timeout):
+        """Run a single solve attempt with the selected engine."""
+        return getattr(self, self.ENGINES[self.engine])(timeout)
+
+    def _cancelled(self):
+        """Check if the attempt has been cancelled from outside (polled with the timeout)."""
+        return self.cancel_check is not None and self.cancel_check()
+
+    def _serialize(self):
+        """Compact form of the board that a worker can rebuild with GraphMultiProcess(board, 'board')."""
+        return {'board': {'dominoes': self.dominoes, 'regions': self.difficulty_data['regions']}}
+
+    def _options(self):
+        """Solver options chosen in solve(), to be replayed on a rebuilt board in a worker."""
+        return {'engine': self.engine, 'forward_check': self.forward_check,
+                'restarts': self.restarts, 'restart_base': self.restart_base, 'propagate': self.propagate,
+                'transpositions': self.transpositions, 'backjump': self.backjump, 'islands': self.islands,
+                'forced': self.forced, 'pairs': self.pairs}
+
+    def _shares_nogoods(self):
+        """Check if parallel workers of this puzzle should share dead states through a SharedNogoods table."""
+        return self.share_nogoods and self.transpositions > 0 and self.engine == 'backtrack'
+
+    def _set_options(self, options):
+        for name, value in options.items():
+            setattr(self, name, value)
     
     def _solve_parallel(self, timeout, max_attempts):
         """Solve using parallel processes for multiple attempts."""
-        overall_start = time.time()
+        if self.pool is not None:
+            solution = self.pool.run(self, timeout, max_attempts)
+            if solution:
+                self._apply_solution(solution)
+                return True
+            return None
         
-        # Use up to 4 processes or max_attempts, whichever is smaller
-        num_processes = min(max_attempts, cpu_count(), 4)
+        deadline = time.time() + timeout
         
-        # Create a queue to collect results
-        result_queue = Queue()
+        # Use up to 4 processes (or the requested number of workers) or max_attempts, whichever is smaller
+        num_processes = min(max_attempts, self.workers or min(cpu_count(), 4))
+        
+        # Each worker reports over its own pipe; the shared event tells losers to stop
+        cancel_event = Event()
+        self.shared_nogoods = SharedNogoods() if self._shares_nogoods() else None
+        readers = {}  # Pipe -> attempt number
         processes = []
         
         # Start parallel attempts
         for attempt in range(num_processes):
+            reader, writer = Pipe(duplex=False)
             p = Process(target=self._solve_attempt_worker, 
-                       args=(attempt, timeout, result_queue))
+                       args=(attempt, timeout, writer, cancel_event))
             p.start()
+            writer.close()  # Keep only the worker's end open, so a dead worker shows up as EOF
+            readers[reader] = attempt
             processes.append(p)
         
-        # Wait for first success or all to finish
+        # Block until a worker reports, stopping at the first success or the deadline
         solution_data = None
-        while time.time() - overall_start < timeout:
-            # Check if any process has found a solution
-            if not result_queue.empty():
-                result, solution = result_queue.get()
-                if result is True:
-                    solution_data = solution
-                    break
-            
-            # Check if all processes are done
-            if all(not p.is_alive() for p in processes):
+        while readers and solution_data is None:
+            remaining = deadline - time.time()
+            if remaining <= 0:
                 break
-            
-            time.sleep(0.01)  # Small sleep to avoid busy waiting
+            for reader in wait(list(readers), timeout=remaining):
+                try:
+                    result, solution, stats = reader.recv()
+                    self.stats.merge(stats)
+                except EOFError:
+                    result, solution = False, None  # Worker exited without reporting
+                attempt = readers.pop(reader)
+                reader.close()
+                if result is True and solution_data is None:
+                    solution_data = solution
+                    self.stats.worker = attempt
         
-        # Terminate remaining processes
+        # Ask the remaining workers to stop; they notice at their next timeout check
+        cancel_event.set()
         for p in processes:
-            if p.is_alive():
+            p.join(timeout=1)
+            if p.is_alive():  # Last resort for a worker that never reached a check
                 p.terminate()
-                p.join(timeout=0.1)
+                p.join()
+        for reader in readers:
+            reader.close()
+        if self.shared_nogoods is not None:
+            self.shared_nogoods.close()
+            self.shared_nogoods = None
         
-        # If we found a solution in the queue, apply it and return
         if solution_data:
             self._apply_solution(solution_data)
             return True
-        
-        # Check queue one more time for any late results
-        while not result_queue.empty():
-            result, solution = result_queue.get()
-            if result is True:
-                self._apply_solution(solution)
-                return True
-        
         return None  # Timeout or all failed
     
-    def _solve_attempt_worker(self, attempt_num, timeout, result_queue):
+    def _solve_attempt_worker(self, attempt_num, timeout, result_conn, cancel_event):
         """Worker function for parallel solving attempts."""
         try:
             # Set unique random seed
             random.seed(attempt_num * 1000 + len(self.nodes))
+            self.cancel_check = cancel_event.is_set
+            # Only this attempt's counts go back to be merged, not the parent's at fork time
+            self.stats = SolveStats()
             
             # Try solving
-            result = self._solve_once(timeout)
+            result = self._run_engine(timeout)
             
             # If solved, serialize and return the solution
             if result is True:
-                solution = {tuple(node.p): node.value for node in self.nodes}
-                result_queue.put((True, solution))
+                solution = {node.p: node.value for node in self.nodes}
+                result_conn.send((True, solution, self.stats))
             else:
-                result_queue.put((result if result is not None else False, None))
+                result_conn.send((result if result is not None else False, None, self.stats))
         except Exception:
-            result_queue.put((False, None))
+            result_conn.send((False, None, self.stats))
+        finally:
+            result_conn.close()
+    
+    @staticmethod
+    def _luby(i):
+        """The i-th term (1-based) of the Luby sequence 1, 1, 2, 1, 1, 2, 4, 1, 1, 2, ..."""
+        k = 1
+        while (1 << k) - 1 < i:
+            k += 1
+        if (1 << k) - 1 == i:
+            return 1 << (k - 1)
+        return GraphMultiProcess._luby(i - (1 << (k - 1)) + 1)
+
+    def _solve_split(self, timeout, num_workers):
+        """Solve by splitting the search tree into disjoint subtrees shared out to worker processes.
+        
+        The frontier of all legal placement paths a few levels deep is queued as subtrees. A worker
+        that runs out of subtrees gets the untried siblings of a busy worker's shallowest open
+        level. No subtree is searched twice, so exhausting them all proves there is no solution.
+        """
+        deadline = time.time() + timeout
+        random.seed(len(self.nodes))
+        
+        # Deepen the frontier until there are several subtrees per worker
+        for depth in range(1, 5):
+            frontier = []
+            result = self._solve_once(deadline - time.time(), collect_depth=depth, frontier=frontier)
+            if result is not False:
+                return result  # Solved (or timed out) before reaching the frontier
+            if not frontier:
+                return False
+            if len(frontier) >= 4 * num_workers:
+                break
+        
+        tasks = Queue()
+        results = Queue()
+        total_tasks = Value('i', len(frontier))  # Grows when a worker hands out part of its subtree
+        hungry = Value('i', 0)  # Number of workers waiting for a subtree
+        cancel_event = Event()
+        for prefix in frontier:
+            tasks.put(prefix)
+        self.shared_nogoods = SharedNogoods() if self._shares_nogoods() else None
+        
+        processes = []
+        for worker in range(num_workers):
+            p = Process(target=self._split_worker,
+                        args=(worker, tasks, results, total_tasks, hungry, cancel_event, deadline))
+            p.start()
+            processes.append(p)
+        
+        solution_data = None
+        exhausted = True
+        finished = 0
+        while solution_data is None and finished < total_tasks.value:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                exhausted = False
+                break
+            try:
+                worker, result, solution, stats = results.get(timeout=remaining)
+            except queue.Empty:
+                exhausted = False
+                break
+            finished += 1
+            self.stats.merge(stats)
+            if result is True:
+                solution_data = solution
+                self.stats.worker = worker
+            elif result is not False:
+                exhausted = False
+        
+        cancel_event.set()
+        for _ in processes:
+            tasks.put(None)
+        for p in processes:
+            p.join(timeout=1)
+            if p.is_alive():
+                p.terminate()
+                p.join()
+        if self.shared_nogoods is not None:
+            self.shared_nogoods.close()
+            self.shared_nogoods = None
+        
+        if solution_data:
+            self._apply_solution(solution_data)
+            return True
+        return False if exhausted else None
+    
+    def _split_worker(self, worker, tasks, results, total_tasks, hungry, cancel_event, deadline):
+        """Worker loop for split mode: search subtrees from tasks until a None task arrives."""
+        self.cancel_check = cancel_event.is_set
+        self.wants_work = lambda: hungry.value > 0
+        
+        def give_work(prefixes):
+            # Count the new subtrees before queueing them, so the parent never sees all work finished early
+            with total_tasks.get_lock():
+                total_tasks.value += len(prefixes)
+            for prefix in prefixes:
+                tasks.put(prefix)
+        self.give_work = give_work
+        
+        while True:
+            with hungry.get_lock():
+                hungry.value += 1
+            prefix = tasks.get()
+            with hungry.get_lock():
+                hungry.value -= 1
+            if prefix is None:
+                break
+            if cancel_event.is_set():
+                continue
+            self.stats = SolveStats()
+            try:
+                random.seed(len(prefix) * 1000 + len(self.nodes))
+                remaining = deadline - time.time()
+                result = self._solve_once(remaining, prefix=prefix) if remaining > 0 else None
+                solution = {node.p: node.value for node in self.nodes} if result is True else None
+            except Exception:
+                result, solution = None, None
+            results.put((worker, result, solution, self.stats))
     
     def _solve_sequential(self, timeout, max_attempts):
         """Original sequential solving (fallback)."""
@@ -221,19 +929,40 @@ class GraphMultiProcess:
             time_per_attempt = (timeout - (time.time() - overall_start)) / (max_attempts - attempt)
             remaining_time = min(timeout - (time.time() - overall_start), time_per_attempt * 1.5)
             
-            result = self._solve_once(remaining_time)
+            result = self._run_engine(remaining_time)
             
-            if result is True:
-                return True
+            # False means the attempt exhausted the search, so no other attempt can succeed
+            if result is not None:
+                return result
         
         return None
     
-    def _solve_once(self, timeout):
-        """Single solve attempt with given timeout using advanced constraint propagation."""
+    def _solve_once(self, timeout, prefix=(), collect_depth=None, frontier=None):
+        """Single solve attempt with given timeout using advanced constraint propagation.
+        
+        Args:
+            timeout: Maximum time in seconds for this attempt
+            prefix: Placements (pos1, pos2, value1, value2) to replay before searching, which
+                restricts the attempt to one subtree of the search
+            collect_depth: If set, the search stops at this depth and appends each path of
+                placements that reaches it to frontier instead of searching below it
+            frontier: List receiving the collected paths when collect_depth is set
+        """
         num_tiles = len(self.nodes)
         if num_tiles % 2 != 0:
             return None
         
+        # Placements forced by presolve() are replayed first, so the search only branches on the rest
+        num_forced = len(self.forced)
+        prefix = tuple(self.forced) + tuple(prefix)
+        if collect_depth is not None:
+            collect_depth += num_forced
+        # Cells presolve() paired are only ever covered together
+        partner = [None] * num_tiles
+        for pos1, pos2 in self.pairs:
+            i, j = self.board.index[tuple(pos1)], self.board.index[tuple(pos2)]
+            partner[i], partner[j] = j, i
+        
         # Initialize all node values to None (unplaced)
         for node in self.nodes:
             node.value = None
@@ -242,64 +971,53 @@ class GraphMultiProcess:
         start_time = time.time()
         timed_out = [False]  # Use list to allow modification in nested functions
         
-        # Pre-compute node degrees (number of neighbors) for MRV heuristic
-        node_degrees = {tuple(node.p): len(node.neighbors) for node in self.nodes}
+        # Running per-region aggregates, updated on place and undone on backtrack
+        regions = self.difficulty_data['regions']
+        region_sizes = [len(r['indices']) for r in regions]
+        region_filled = [0] * len(regions)
+        region_sums = [0] * len(regions)
+        region_counts = [[0] * 7 for _ in regions]  # Histogram of placed pip values
         
-        def find_region(node):
-            """Find all nodes in the same region as the given node (using precomputed cache)."""
-            return self.node_to_region[tuple(node.p)]
+        # Pips still left in the remaining dominoes, bucketed by value, for bound propagation
+        pip_counts = [0] * 7
+        for domino in self.dominoes:
+            pip_counts[int(domino[0])] += 1
+            pip_counts[int(domino[1])] += 1
+        bounded_regions = [r for r, region in enumerate(regions)
+                           if region.get('type') in ('sum', 'less', 'greater') and region.get('target') is not None]
+        check_constraints, region_bounds, bounds_feasible = _region_checks(regions, region_filled, region_sums,
+                                                                           region_counts, pip_counts)
         
-        def check_constraints(node, domino_value, region_nodes):
-            """Check if placing a domino value satisfies the region's constraints."""
-            # Get all placed values in the region
-            placed_values = [n.value for n in region_nodes if n.value is not None]
-            all_values = placed_values + [domino_value]
-            
-            # Count how many nodes in the region are still empty
-            empty_count = sum(1 for n in region_nodes if n.value is None)
-            is_full = (empty_count == 1)  # Will be full after placing this value
-            
-            # Check constraints based on type
-            if node.type == 'empty':
-                return True
-            
-            if node.type == 'equals':
-                if len(set(all_values)) > 1:
-                    return False
-            
-            if node.type == 'unequal':
-                if len(set(all_values)) != len(all_values):
-                    return False
-            
-            if node.type == 'less':
-                if node.target is not None and sum(all_values) >= node.target:
-                    return False
-            
-            if node.type == 'greater':
-                if node.target is not None and is_full and sum(all_values) <= node.target:
-                    return False
-            
-            if node.type == 'sum':
-                if node.target is not None:
-                    s = sum(all_values)
-                    if s > node.target or (is_full and s != node.target):
-                        return False
-            
-            return True
+        def set_value(node, value):
+            """Place a pip value on a node and update its region's aggregates."""
+            r = node.region
+            node.value = value
+            region_filled[r] += 1
+            region_sums[r] += value
+            region_counts[r][value] += 1
+        
+        def clear_value(node):
+            """Remove a node's pip value and undo its region's aggregates."""
+            r = node.region
+            region_filled[r] -= 1
+            region_sums[r] -= node.value
+            region_counts[r][node.value] -= 1
+            node.value = None
         
         def check_domino_placement(node1, node2, domino):
-            """Check if a domino can be placed at two nodes."""
-            region1 = find_region(node1)
-            region2 = find_region(node2)
+            """Place a domino at two nodes if both halves satisfy their regions' constraints.
             
-            # Check first position
-            if not check_constraints(node1, int(domino[0]), region1):
+            The first half is placed before the second is checked, so a domino lying inside
+            a single region is checked as a whole. Returns False with nothing placed otherwise.
+            """
+            v1, v2 = int(domino[0]), int(domino[1])
+            if not check_constraints(node1.region, v1):
                 return False
-            
-            # Check second position
-            if not check_constraints(node2, int(domino[1]), region2):
+            set_value(node1, v1)
+            if not check_constraints(node2.region, v2):
+                clear_value(node1)
                 return False
-            
+            set_value(node2, v2)
             return True
         
         def find_next_empty():
@@ -323,85 +1041,719 @@ class GraphMultiProcess:
             
             return best_node
         
-        def has_dead_end():
-            """Check if any empty node has no valid neighbors (dead end detection)."""
+        def find_dead_end():
+            """Find an empty node with no empty neighbors (dead end detection), or None."""
             for node in self.nodes:
                 if node.value is None:
                     empty_neighbors = sum(1 for n in node.neighbors if n.value is None)
                     if empty_neighbors == 0:
-                        return True
+                        return node
+            return None
+        
+        # Domino tiling of the empty cells, kept as a bipartite perfect matching over the grid
+        mate = {node: None for node in self.nodes}
+        
+        def find_augmenting_path(start, end):
+            """BFS for an alternating path between two unmatched empty nodes."""
+            parent = {start: None}
+            queue = [start]
+            for u in queue:
+                for w in u.neighbors:
+                    if w.value is not None or w in parent:
+                        continue
+                    parent[w] = u
+                    if w is end or (end is None and mate[w] is None):
+                        return w, parent
+                    x = mate[w]
+                    if x is not None and x not in parent:
+                        parent[x] = w
+                        queue.append(x)
+            return None, parent
+        
+        def augment(w, parent, trail):
+            """Flip the matching along the path ending at w, recording old mates in trail."""
+            while w is not None:
+                u = parent[w]
+                prev = mate[u]
+                trail.append((w, mate[w]))
+                trail.append((u, prev))
+                mate[w], mate[u] = u, w
+                w = prev
+        
+        def build_tiling():
+            """Find an initial perfect matching of all nodes, or return False if none exists."""
+            for node in self.nodes:
+                if (node.p[0] + node.p[1]) % 2 == 0 and mate[node] is None:
+                    w, parent = find_augmenting_path(node, None)
+                    if w is None:
+                        return False
+                    augment(w, parent, [])
+            return all(mate[node] is not None for node in self.nodes)
+        
+        def repair_tiling(node1, node2, trail):
+            """Update the matching after node1 and node2 are filled; False if no tiling remains."""
+            mate1, mate2 = mate[node1], mate[node2]
+            trail.append((node1, mate1))
+            trail.append((node2, mate2))
+            mate[node1] = mate[node2] = None
+            if mate1 is node2:
+                return True
+            # The former partners are now unmatched and must be joined by an augmenting path
+            trail.append((mate1, node1))
+            trail.append((mate2, node2))
+            mate[mate1] = mate[mate2] = None
+            w, parent = find_augmenting_path(mate1, mate2)
+            if w is None:
+                return False
+            augment(w, parent, trail)
+            return True
+        
+        def undo_tiling(trail):
+            for node, old_mate in reversed(trail):
+                mate[node] = old_mate
+        
+        use_tiling = self.forward_check == 'tiling'
+        
+        # Remaining dominoes as a canonical multiset: each distinct (low, high) domino with a count
+        # Kinds come from the feasibility tables, which also give the placements worth trying
+        domino_kinds, neighbor_tables, cell_kinds = self._compile_feasibility()
+        kind_index = {kind: k for k, kind in enumerate(domino_kinds)}
+        domino_counts = [0] * len(domino_kinds)
+        for domino in self.dominoes:
+            domino_counts[kind_index[tuple(sorted((int(domino[0]), int(domino[1]))))]] += 1
+        remaining = [len(self.dominoes)]
+        
+        # Per-cell pip domains as 7-bit masks, narrowed by AC-3 and restored from domain_trail
+        use_propagation = self.propagate
+        nodes = self.nodes
+        domains = [0] * num_tiles
+        for node in nodes:
+            for table in neighbor_tables[node.index]:
+                for k, (lo, hi) in enumerate(domino_kinds):
+                    if table[k][0]:
+                        domains[node.index] |= 1 << lo
+                    if table[k][1]:
+                        domains[node.index] |= 1 << hi
+        domain_trail = []
+        region_cells = [[] for _ in regions]
+        for node in nodes:
+            region_cells[node.region].append(node.index)
+        
+        def narrow(i, new, queue):
+            """Shrink the domain of nodes[i] to new, queueing what depends on it. False on wipe-out."""
+            old = domains[i]
+            if new == old:
+                return True
+            if not new:
+                return False
+            domain_trail.append((i, old))
+            domains[i] = new
+            queue.append(('region', nodes[i].region))
+            for n in nodes[i].neighbors:
+                if n.value is None:
+                    queue.append(('cell', n.index))
+            return True
+        
+        def revise_region(r, queue):
+            """Make the empty cells of region r consistent with its constraint."""
+            region_type = regions[r].get('type')
+            target = regions[r].get('target')
+            empty = [i for i in region_cells[r] if nodes[i].value is None]
+            if not empty:
+                return True
+            
+            if region_type == 'equals':
+                # All cells share one domain, or the pip already placed in the region
+                if region_filled[r]:
+                    mask = 1 << region_counts[r].index(region_filled[r])
+                else:
+                    mask = 0x7f
+                    for i in empty:
+                        mask &= domains[i]
+                for i in empty:
+                    if not narrow(i, domains[i] & mask, queue):
+                        return False
+            
+            elif region_type == 'unequal':
+                # Remove placed pips and the pips of cells already down to a single value
+                taken = sum(1 << v for v in range(7) if region_counts[r][v])
+                for i in empty:
+                    if not narrow(i, domains[i] & ~taken, queue):
+                        return False
+                for i in empty:
+                    d = domains[i]
+                    if not d & (d - 1):
+                        for j in empty:
+                            if j != i and not narrow(j, domains[j] & ~d, queue):
+                                return False
+                # Pigeonhole: the empty cells need as many distinct pips as there are cells
+                union = 0
+                for i in empty:
+                    union |= domains[i]
+                if union.bit_count() < len(empty):
+                    return False
+            
+            elif region_type in ('sum', 'less', 'greater') and target is not None:
+                # Each cell's pip must leave the rest of the region able to meet the target
+                lows = [(domains[i] & -domains[i]).bit_length() - 1 for i in empty]
+                highs = [domains[i].bit_length() - 1 for i in empty]
+                total_low, total_high = sum(lows), sum(highs)
+                base = region_sums[r]
+                for i, low, high in zip(empty, lows, highs):
+                    min_rest = base + total_low - low
+                    max_rest = base + total_high - high
+                    lo_v, hi_v = 0, 6
+                    if region_type == 'sum':
+                        lo_v, hi_v = target - max_rest, target - min_rest
+                    elif region_type == 'less':
+                        hi_v = target - 1 - min_rest
+                    else:
+                        lo_v = target + 1 - max_rest
+                    lo_v, hi_v = max(lo_v, 0), min(hi_v, 6)
+                    mask = ((1 << (hi_v + 1)) - 1) & ~((1 << lo_v) - 1) if lo_v <= hi_v else 0
+                    if not narrow(i, domains[i] & mask, queue):
+                        return False
+            return True
+        
+        def revise_cell(i, queue):
+            """Keep only pips of nodes[i] that some remaining domino can cover with an empty neighbor."""
+            node = nodes[i]
+            support = 0
+            for n, table in zip(node.neighbors, neighbor_tables[i]):
+                if n.value is not None:
+                    continue
+                dn = domains[n.index]
+                for k in cell_kinds[i]:
+                    if domino_counts[k]:
+                        lo, hi = domino_kinds[k]
+                        if table[k][0] and dn >> hi & 1:
+                            support |= 1 << lo
+                        if table[k][1] and dn >> lo & 1:
+                            support |= 1 << hi
+            return narrow(i, domains[i] & support, queue)
+        
+        def run_ac3(queue):
+            """Revise queued regions and cells until nothing changes. False if a domain is wiped out."""
+            queued = set(queue)
+            queue = list(queued)
+            while queue:
+                item = queue.pop()
+                queued.discard(item)
+                new_items = []
+                kind, x = item
+                if kind == 'region':
+                    ok = revise_region(x, new_items)
+                elif nodes[x].value is not None:
+                    ok = True
+                else:
+                    ok = revise_cell(x, new_items)
+                if not ok:
+                    return False
+                for new_item in new_items:
+                    if new_item not in queued:
+                        queued.add(new_item)
+                        queue.append(new_item)
+            return True
+        
+        def propagate(node, neighbor, k):
+            """Fix the domains of a placed domino and restore arc consistency."""
+            queue = []
+            if not narrow(node.index, 1 << node.value, queue) or not narrow(neighbor.index, 1 << neighbor.value, queue):
+                return False
+            queue.append(('region', node.region))
+            queue.append(('region', neighbor.region))
+            if not domino_counts[k]:
+                # The last domino of this kind is gone: cells relying on its pips need new support
+                lost = (1 << node.value) | (1 << neighbor.value)
+                queue.extend(('cell', n.index) for n in nodes if n.value is None and domains[n.index] & lost)
+            return run_ac3(queue)
+        
+        def undo_domains(mark):
+            while len(domain_trail) > mark:
+                i, old = domain_trail.pop()
+                domains[i] = old
+        
+        # Zobrist hash of everything the rest of the search depends on: the filled cells, the sum or
+        # placed pips of each unfinished region and the remaining dominoes. Subtrees searched to the
+        # end without a solution are remembered by hash in dead_states, shared by later attempts
+        use_transpositions = self.transpositions > 0 and collect_depth is None
+        if use_transpositions:
+            cell_keys, sum_keys, value_keys, count_keys = self._compile_zobrist()
+            if self._dead_states is None:
+                self._dead_states = OrderedDict()
+            dead_states = self._dead_states
+        shared_nogoods = self.shared_nogoods if use_transpositions else None
+        nogood_salt = self.nogood_salt
+        hash_sums = [region.get('type') in ('sum', 'less', 'greater') and region.get('target') is not None
+                     for region in regions]
+        hash_values = [region.get('type') in ('equals', 'unequal') for region in regions]
+        shares = [0]  # Times share_work gave away untried siblings, leaving open levels unfinished
+        
+        def region_key(r):
+            """Zobrist key of what the rest of the search needs to know about region r."""
+            if region_filled[r] == region_sizes[r]:
+                return 0
+            if hash_sums[r]:
+                return sum_keys[r][region_sums[r]]
+            key = 0
+            if hash_values[r]:
+                counts = region_counts[r]
+                for v in range(7):
+                    if counts[v]:
+                        key ^= value_keys[r][v]
+            return key
+        
+        def regions_key(node1, node2):
+            if node1.region == node2.region:
+                return region_key(node1.region)
+            return region_key(node1.region) ^ region_key(node2.region)
+        
+        state_hash = [0]
+        if use_transpositions:
+            for r in range(len(regions)):
+                state_hash[0] ^= region_key(r)
+            for k, count in enumerate(domino_counts):
+                state_hash[0] ^= count_keys[k][count]
+        
+        # Placements on the current search path as (pos1, pos2, value1, value2), and the candidate
+        # iterator of every open level, so untried siblings can be handed to idle workers
+        path = []
+        open_levels = []
+        pos_to_node = {node.p: node for node in self.nodes}
+        
+        # Conflict-directed backjumping: levels are indices into path, and a failed level leaves in
+        # conflict[0] a bitmask of the earlier levels its failure depends on. Region and domino kind
+        # dependencies are tracked exactly; forward-check failures depend on every earlier level
+        use_backjump = self.backjump
+        cell_level = [0] * num_tiles  # Level that filled each cell
+        region_levels = [0] * len(regions)  # Levels that placed a pip in each region
+        kind_levels = [0] * len(domino_kinds)  # Levels that used a domino of each kind
+        pip_levels = [0] * 7  # Levels that took a pip of each value from the remaining dominoes
+        conflict = [0]
+        
+        def filler_levels(node):
+            """Bitmask of the levels that filled the neighbors of node."""
+            mask = 0
+            for n in node.neighbors:
+                if n.value is not None:
+                    mask |= 1 << cell_level[n.index]
+            return mask
+        
+        def bounds_levels():
+            """Levels a failed bounds_feasible() depends on.
+            
+            The bound of the first region out of reach comes from its own placements and from the
+            pips left: the pips taken by other levels would only push it further from the target.
+            """
+            for r in bounded_regions:
+                if region_filled[r] == region_sizes[r]:
+                    continue
+                low, high = region_bounds(r)
+                target = regions[r]['target']
+                region_type = regions[r]['type']
+                need = region_sizes[r] - region_filled[r]
+                if (region_type == 'sum' and low > target) or (region_type == 'less' and low >= target):
+                    # Only a pip below the largest one in the minimum could lower it
+                    for cut in range(7):
+                        need -= pip_counts[cut]
+                        if need <= 0:
+                            break
+                    taken = range(cut)
+                elif (region_type == 'sum' and high < target) or (region_type == 'greater' and high <= target):
+                    for cut in range(6, -1, -1):
+                        need -= pip_counts[cut]
+                        if need <= 0:
+                            break
+                    taken = range(cut + 1, 7)
+                else:
+                    continue
+                mask = region_levels[r]
+                for v in taken:
+                    mask |= pip_levels[v]
+                return mask
+            return (1 << len(path)) - 1
+        
+        # Islands: groups of empty cells linked by adjacency or by an unfinished constrained region.
+        # Islands only interact through the remaining dominoes, so the smallest one is filled first,
+        # once per distinct multiset of domino kinds it can take, by replaying one arrangement of it
+        # from pending as forced placements. Its multisets are cached by cells and region state
+        use_islands = self.islands and collect_depth is None
+        coupled = [region.get('type', 'empty') != 'empty' for region in regions]
+        links = [sorted({n.index for n in node.neighbors}
+                        | (set(region_cells[node.region]) - {node.index} if coupled[node.region] else set()))
+                 for node in nodes]
+        split = [False] * (num_tiles // 2 + 1)  # Whether the state at each depth had several islands
+        island_cache = {}
+        pending = []  # Forced placements (node, (kind, domino, neighbor)) left to replay, last first
+        
+        def smallest_island(depth):
+            """Cell indices of the smallest island if the empty cells form several, else None."""
+            if depth > len(prefix) and not split[depth - 1]:
+                # The last domino can only cut the empty cells apart if it linked two groups of them
+                node1, node2 = pos_to_node[path[-1][0]], pos_to_node[path[-1][1]]
+                groups = sum(1 for n in node1.neighbors if n.value is None) + sum(1 for n in node2.neighbors if n.value is None)
+                for r in {node1.region, node2.region}:
+                    if coupled[r] and region_filled[r] < region_sizes[r]:
+                        groups += 1
+                if groups < 2:
+                    split[depth] = False
+                    return None
+            seen = [False] * num_tiles
+            islands = []
+            for start in nodes:
+                if start.value is not None or seen[start.index]:
+                    continue
+                seen[start.index] = True
+                island = [start.index]
+                for i in island:
+                    for j in links[i]:
+                        if not seen[j] and nodes[j].value is None:
+                            seen[j] = True
+                            island.append(j)
+                islands.append(island)
+            split[depth] = len(islands) > 1
+            if not split[depth]:
+                return None
+            return min(islands, key=len)
+        
+        def island_subsets(island):
+            """(Counter of domino kinds, arrangement) for each distinct multiset of dominoes that can fill island.
+            
+            Returns None if the island is too large or its enumeration runs out of nodes.
+            """
+            if len(island) > self.ISLAND_CELLS:
+                return None
+            cells = [nodes[i] for i in island]
+            island_regions = sorted({node.region for node in cells})
+            key = (frozenset(island), tuple((r, region_sums[r], tuple(region_counts[r])) for r in island_regions))
+            cached = island_cache.get(key)
+            # Subsets found with at least the dominoes left now are still complete
+            if cached is not None and all(c >= n for c, n in zip(cached[0], domino_counts)):
+                return cached[1]
+            
+            found = {}
+            used = []
+            moves = []
+            budget = [self.ISLAND_NODES]
+            
+            def fill():
+                budget[0] -= 1
+                if budget[0] < 0:
+                    return False
+                best, fewest = None, 5
+                for node in cells:
+                    if node.value is None:
+                        empty_count = sum(1 for n in node.neighbors if n.value is None)
+                        if empty_count < fewest:
+                            best, fewest = node, empty_count
+                if best is None:
+                    found.setdefault(tuple(sorted(used)), tuple(moves))
+                    return True
+                for neighbor, table in zip(best.neighbors, neighbor_tables[best.index]):
+                    if (neighbor.value is not None or partner[best.index] not in (None, neighbor.index)
+                            or partner[neighbor.index] not in (None, best.index)):
+                        continue
+                    for k in cell_kinds[best.index]:
+                        if not domino_counts[k]:
+                            continue
+                        for o in (0, 1) if domino_kinds[k][0] != domino_kinds[k][1] else (0,):
+                            if not table[k][o]:
+                                continue
+                            current_domino = domino_kinds[k][::-1] if o else domino_kinds[k]
+                            if not check_domino_placement(best, neighbor, current_domino):
+                                continue
+                            domino_counts[k] -= 1
+                            used.append(k)
+                            moves.append((best, (k, current_domino, neighbor)))
+                            complete = fill()
+                            moves.pop()
+                            used.pop()
+                            domino_counts[k] += 1
+                            clear_value(neighbor)
+                            clear_value(best)
+                            if not complete:
+                                return False
+                return True
+            
+            complete = fill()
+            stats.nodes += self.ISLAND_NODES - max(budget[0], 0)
+            if not complete:
+                return None
+            subsets = [(Counter(kinds), arrangement) for kinds, arrangement in found.items()]
+            if len(island_cache) > 4096:
+                island_cache.clear()
+            island_cache[key] = (tuple(domino_counts), subsets)
+            return subsets
+        
+        def fill_island(subsets):
+            """Search on from each arrangement in subsets whose dominoes are still left."""
+            for kinds, arrangement in subsets:
+                if any(domino_counts[k] < n for k, n in kinds.items()):
+                    continue
+                pending.extend(reversed(arrangement))
+                found = backtrack()
+                del pending[len(pending) - len(arrangement):]
+                if found:
+                    return True
             return False
         
-        def place_domino(node, remaining_dominoes):
-            """Try to place dominoes with constraint propagation and pruning."""
+        def generate_candidates(node):
+            """Yield (domino kind, oriented domino, neighbor) in search order for node."""
             # Sort neighbors by degree (prefer neighbors with fewer options)
-            empty_neighbors = [n for n in node.neighbors if n.value is None]
-            if not empty_neighbors:
-                return False  # Dead end
+            empty_neighbors = [(n, table) for n, table in zip(node.neighbors, neighbor_tables[node.index])
+                               if n.value is None and partner[node.index] in (None, n.index)
+                               and partner[n.index] in (None, node.index)]
             
             # Sort by number of empty neighbors (prefer more constrained)
-            empty_neighbors.sort(key=lambda n: sum(1 for x in n.neighbors if x.value is None))
+            empty_neighbors.sort(key=lambda nt: sum(1 for x in nt[0].neighbors if x.value is None))
             
-            # Simple randomization - avoid expensive priority calculation
-            dominoes_to_try = remaining_dominoes[:]
-            random.shuffle(dominoes_to_try)
+            # Simple randomization - each distinct domino is tried once per node,
+            # skipping kinds that can never be placed on this node
+            kinds_to_try = [k for k in cell_kinds[node.index] if domino_counts[k]]
+            random.shuffle(kinds_to_try)
             
-            for domino in dominoes_to_try:
+            for k in kinds_to_try:
+                domino = domino_kinds[k]
                 # Try both orientations if values are different
                 orientations = [domino]
                 if domino[0] != domino[1]:
                     orientations.append(domino[::-1])
                 
-                for current_domino in orientations:
-                    # Try placing domino on sorted neighbors
-                    for neighbor in empty_neighbors:
-                        # Check if placement is valid
-                        if check_domino_placement(node, neighbor, current_domino):
-                            # Place the domino
-                            node.value = int(current_domino[0])
-                            neighbor.value = int(current_domino[1])
-                            
-                            # Forward checking: did we create a dead end?
-                            if not has_dead_end():
-                                # Remove domino from available dominoes
-                                new_dominoes = remaining_dominoes[:]
-                                new_dominoes.remove(domino)
-                                
-                                # Backtrack
-                                result = backtrack(new_dominoes)
-                                if result:
-                                    return True
-                            
-                            # Undo placement
-                            node.value = None
-                            neighbor.value = None
+                for o, current_domino in enumerate(orientations):
+                    # Try placing domino on sorted neighbors where it is statically allowed
+                    for neighbor, table in empty_neighbors:
+                        if table[k][o]:
+                            yield k, current_domino, neighbor
+        
+        def place_domino(node, forced=None):
+            """Try to place dominoes with constraint propagation and pruning."""
+            if not any(n.value is None for n in node.neighbors):
+                if use_backjump:
+                    conflict[0] = filler_levels(node)
+                return False  # Dead end
+            
+            level = len(path)
+            level_conflict = all_levels = 0
+            if use_backjump:
+                # Candidates are limited by the filled neighbors and by the dominoes already used up
+                all_levels = (1 << level) - 1
+                level_conflict = filler_levels(node)
+                for k in cell_kinds[node.index]:
+                    if not domino_counts[k]:
+                        level_conflict |= kind_levels[k]
+            
+            candidates = iter([forced]) if forced is not None else generate_candidates(node)
+            open_levels.append((node, candidates))
+            try:
+                for k, current_domino, neighbor in candidates:
+                    if use_propagation and not (domains[node.index] >> current_domino[0] & 1
+                                                and domains[neighbor.index] >> current_domino[1] & 1):
+                        level_conflict |= all_levels
+                        continue
+                    
+                    if use_transpositions:
+                        saved_hash = state_hash[0]
+                        old_keys = regions_key(node, neighbor)
+                    
+                    # Place the domino if the placement is valid
+                    stats.placements += 1
+                    if not check_domino_placement(node, neighbor, current_domino):
+                        prunes['constraint'] += 1
+                        if use_backjump:
+                            level_conflict |= region_levels[node.region] | region_levels[neighbor.region]
+                        continue
+                    
+                    # Remove domino from available dominoes
+                    domino_counts[k] -= 1
+                    remaining[0] -= 1
+                    pip_counts[node.value] -= 1
+                    pip_counts[neighbor.value] -= 1
+                    path.append((node.p, neighbor.p, node.value, neighbor.value))
+                    if use_transpositions:
+                        state_hash[0] ^= (old_keys ^ regions_key(node, neighbor) ^ cell_keys[node.index] ^ cell_keys[neighbor.index]
+                                          ^ count_keys[k][domino_counts[k] + 1] ^ count_keys[k][domino_counts[k]])
+                    if use_backjump:
+                        bit = 1 << level
+                        cell_level[node.index] = cell_level[neighbor.index] = level
+                        region_levels[node.region] |= bit
+                        region_levels[neighbor.region] |= bit
+                        kind_levels[k] |= bit
+                        pip_levels[node.value] |= bit
+                        pip_levels[neighbor.value] |= bit
+                    
+                    # Forward checking: did we create a dead end or an unreachable target?
+                    if use_tiling:
+                        trail = []
+                        feasible = repair_tiling(node, neighbor, trail)
+                    else:
+                        dead_end = find_dead_end()
+                        feasible = dead_end is None
+                    mark = len(domain_trail)
+                    jump = False
+                    if not feasible:
+                        prunes['tiling' if use_tiling else 'dead_end'] += 1
+                        if use_backjump:
+                            # An isolated cell only depends on the placements around it
+                            level_conflict |= all_levels if use_tiling else filler_levels(dead_end)
+                    elif not bounds_feasible():
+                        prunes['bounds'] += 1
+                        if use_backjump:
+                            level_conflict |= bounds_levels()
+                    elif use_propagation and not propagate(node, neighbor, k):
+                        prunes['propagation'] += 1
+                        level_conflict |= all_levels
+                    elif backtrack():
+                        return True
+                    elif use_backjump:
+                        # The subtree failed for reasons that do not involve this level: no other
+                        # candidate here can fix it, so pass its conflict straight up
+                        jump = not conflict[0] >> level & 1
+                        level_conflict |= conflict[0]
+                    if use_tiling:
+                        undo_tiling(trail)
+                    undo_domains(mark)
+                    
+                    # Restore domino
+                    path.pop()
+                    domino_counts[k] += 1
+                    remaining[0] += 1
+                    pip_counts[node.value] += 1
+                    pip_counts[neighbor.value] += 1
+                    
+                    # Undo placement
+                    if use_backjump:
+                        region_levels[node.region] &= ~bit
+                        region_levels[neighbor.region] &= ~bit
+                        kind_levels[k] &= ~bit
+                        pip_levels[node.value] &= ~bit
+                        pip_levels[neighbor.value] &= ~bit
+                    clear_value(neighbor)
+                    clear_value(node)
+                    if use_transpositions:
+                        state_hash[0] = saved_hash
+                    if jump:
+                        stats.backjumps += 1
+                        return False
+            finally:
+                open_levels.pop()
             
+            if use_backjump:
+                conflict[0] = level_conflict & all_levels
             return False
         
+        def share_work():
+            """Hand the untried siblings of the shallowest open level to idle workers."""
+            for depth, (node, candidates) in enumerate(open_levels):
+                rest = list(candidates)
+                if rest:
+                    shares[0] += 1
+                    self.give_work([tuple(path[num_forced:depth]) + ((node.p, neighbor.p) + tuple(current_domino),)
+                                    for _, current_domino, neighbor in rest])
+                    return
+        
         # Timeout check counter for efficiency
         backtrack_calls = [0]
+        stats = self.stats
+        prunes = stats.prunes
+        # Backtrack calls at which the current run of a restart policy is abandoned
+        restart_at = [None]
         
-        def backtrack(remaining_dominoes):
+        def backtrack():
             """Backtrack to find a valid solution."""
             # Check timeout every 200 calls (more efficient)
             backtrack_calls[0] += 1
             if backtrack_calls[0] % 200 == 0:
-                if time.time() - start_time > timeout:
+                if time.time() - start_time > timeout or self._cancelled():
                     timed_out[0] = True
+                elif self.wants_work is not None and self.wants_work():
+                    share_work()
+            if timed_out[0] or (restart_at[0] is not None and backtrack_calls[0] > restart_at[0]):
+                return False
+            
+            depth = len(path)
+            if depth > stats.max_depth:
+                stats.max_depth = depth
+            if depth < len(prefix):
+                # Replay the placement this subtree starts from
+                pos1, pos2, v1, v2 = prefix[depth]
+                return place_domino(pos_to_node[tuple(pos1)], (kind_index[tuple(sorted((v1, v2)))], (v1, v2), pos_to_node[tuple(pos2)]))
+            # Failures found without trying a placement here depend on every level above
+            conflict[0] = (1 << depth) - 1
+            if pending:
+                # Replay the next placement of the island arrangement being tried
+                split[depth] = True
+                forced = pending.pop()
+                try:
+                    return place_domino(*forced)
+                finally:
+                    pending.append(forced)
+            if collect_depth is not None and depth == collect_depth:
+                frontier.append(tuple(path[num_forced:]))
+                return False
+            if use_transpositions:
+                key = state_hash[0]
+                if key in dead_states:
+                    dead_states.move_to_end(key)
+                    prunes['transposition'] += 1
                     return False
+                if shared_nogoods is not None and (key ^ nogood_salt) in shared_nogoods:
+                    prunes['shared_nogood'] += 1
+                    return False
+                shared = shares[0]
             
             # Find next empty node
             node = find_next_empty()
             
             # If no empty nodes, check if all dominoes are placed
             if node is None:
-                return len(remaining_dominoes) == 0
+                return remaining[0] == 0
             
+            island = smallest_island(depth) if use_islands else None
+            subsets = island_subsets(island) if island is not None else None
+            if subsets is not None:
+                if fill_island(subsets):
+                    return True
+                conflict[0] = (1 << depth) - 1
             # Try placing a domino at this node
-            return place_domino(node, remaining_dominoes)
+            elif place_domino(node):
+                return True
+            # Remember the state only if its whole subtree was searched
+            if (use_transpositions and not timed_out[0] and shares[0] == shared
+                    and (restart_at[0] is None or backtrack_calls[0] <= restart_at[0])):
+                dead_states[key] = None
+                if len(dead_states) > self.transpositions:
+                    dead_states.popitem(last=False)
+                if shared_nogoods is not None:
+                    shared_nogoods.add(key ^ nogood_salt)
+            return False
         
         # Start backtracking with all dominoes
-        success = backtrack(self.dominoes)
+        if not bounds_feasible():
+            return False
+        if use_tiling and not build_tiling():
+            return False
+        if use_propagation:
+            initial = [('region', r) for r in range(len(regions))] + [('cell', node.index) for node in nodes]
+            if not run_ac3(initial):
+                return False
+        
+        # Each restart unwinds the whole search, then starts over with a new random order
+        use_restarts = self.restarts is not None and collect_depth is None
+        run = 0
+        while True:
+            if use_restarts:
+                run += 1
+                if run > 1:
+                    stats.restarts += 1
+                if self.restarts == 'luby':
+                    limit = self.restart_base * self._luby(run)
+                else:
+                    limit = int(self.restart_base * 1.5 ** (run - 1))
+                restart_at[0] = backtrack_calls[0] + limit
+            success = backtrack()
+            if success or timed_out[0] or restart_at[0] is None or backtrack_calls[0] <= restart_at[0]:
+                break
+        stats.nodes += backtrack_calls[0]
         
         # Return None if timed out, otherwise return success status
         if timed_out[0]:
@@ -415,11 +1767,673 @@ class GraphMultiProcess:
         #     #print("❌")
         #     return False
 
+    def _solve_bitboard(self, timeout):
+        """Single solve attempt on a bitmask representation of the board.
+
+        Same search as _solve_once, but the set of empty cells is an integer mask, so MRV
+        selection and isolated-cell checks are popcounts instead of scans over Node objects.
+        """
+        num_tiles = len(self.nodes)
+        if num_tiles % 2 != 0:
+            return None
+
+        for node in self.nodes:
+            node.value = None
+
+        start_time = time.time()
+        timed_out = [False]
+
+        neighbor_masks, cell_region, region_masks, _, _ = self._compile_bitboard()
+        values = [None] * num_tiles
+        region_filled = [0] * len(region_masks)
+        region_sums = [0] * len(region_masks)
+        region_counts = [[0] * 7 for _ in region_masks]
+        check_region, _, _ = _region_checks(self.difficulty_data['regions'], region_filled, region_sums,
+                                            region_counts)
+        dominoes = [(int(d[0]), int(d[1])) for d in self.dominoes]
+        state = {'empty': (1 << num_tiles) - 1, 'available': (1 << len(dominoes)) - 1}
+
+        def bits(mask):
+            """Yield the index of every set bit in mask."""
+            while mask:
+                low = mask & -mask
+                yield low.bit_length() - 1
+                mask ^= low
+
+        def check_constraints(cell, value):
+            """Check if placing value at cell satisfies its region's constraint."""
+            return check_region(cell_region[cell], value)
+
+        def set_value(cell, value):
+            r = cell_region[cell]
+            values[cell] = value
+            state['empty'] &= ~(1 << cell)
+            region_filled[r] += 1
+            region_sums[r] += value
+            region_counts[r][value] += 1
+
+        def clear_value(cell, value):
+            r = cell_region[cell]
+            values[cell] = None
+            state['empty'] |= 1 << cell
+            region_filled[r] -= 1
+            region_sums[r] -= value
+            region_counts[r][value] -= 1
+
+        def find_next_empty():
+            """Find the empty cell with the fewest empty neighbors (MRV)."""
+            empty = state['empty']
+            best_cell, min_empty_neighbors = None, 5
+            for cell in bits(empty):
+                count = (neighbor_masks[cell] & empty).bit_count()
+                if count < min_empty_neighbors:
+                    best_cell, min_empty_neighbors = cell, count
+                    if count <= 1:
+                        break
+            return best_cell
+
+        def has_dead_end(cell1, cell2):
+            """Check if filling cell1 and cell2 isolated any of their empty neighbors."""
+            empty = state['empty']
+            for cell in bits((neighbor_masks[cell1] | neighbor_masks[cell2]) & empty):
+                if not neighbor_masks[cell] & empty:
+                    return True
+            return False
+
+        def place_domino(cell):
+            """Try every available domino, orientation and empty neighbor at cell."""
+            empty = state['empty']
+            empty_neighbors = list(bits(neighbor_masks[cell] & empty))
+            if not empty_neighbors:
+                return False
+
+            empty_neighbors.sort(key=lambda n: (neighbor_masks[n] & empty).bit_count())
+
+            dominoes_to_try = list(bits(state['available']))
+            random.shuffle(dominoes_to_try)
+
+            for i in dominoes_to_try:
+                domino = dominoes[i]
+                orientations = [domino]
+                if domino[0] != domino[1]:
+                    orientations.append(domino[::-1])
+
+                for v1, v2 in orientations:
+                    stats.placements += len(empty_neighbors)
+                    if not check_constraints(cell, v1):
+                        prunes['constraint'] += len(empty_neighbors)
+                        continue
+                    set_value(cell, v1)
+                    for neighbor in empty_neighbors:
+                        if not check_constraints(neighbor, v2):
+                            prunes['constraint'] += 1
+                            continue
+                        set_value(neighbor, v2)
+                        if has_dead_end(cell, neighbor):
+                            prunes['dead_end'] += 1
+                        else:
+                            state['available'] &= ~(1 << i)
+                            if backtrack():
+                                return True
+                            state['available'] |= 1 << i
+                        clear_value(neighbor, v2)
+                    clear_value(cell, v1)
+
+            return False
+
+        backtrack_calls = [0]
+        stats = self.stats
+        prunes = stats.prunes
+
+        def backtrack():
+            """Backtrack to find a valid solution."""
+            backtrack_calls[0] += 1
+            if backtrack_calls[0] % 200 == 0:
+                if time.time() - start_time > timeout or self._cancelled():
+                    timed_out[0] = True
+            if timed_out[0]:
+                return False
+            depth = len(dominoes) - state['available'].bit_count()
+            if depth > stats.max_depth:
+                stats.max_depth = depth
+
+            cell = find_next_empty()
+            if cell is None:
+                return state['available'] == 0
+            return place_domino(cell)
+
+        empty = state['empty']
+        if any(not neighbor_masks[cell] & empty for cell in bits(empty)):
+            return False
+
+        success = backtrack()
+        stats.nodes += backtrack_calls[0]
+        if timed_out[0]:
+            return None
+        if success:
+            for node, value in zip(self.nodes, values):
+                node.value = value
+        return success
+
+    def _solve_iterative(self, timeout):
+        """Single solve attempt driven by an explicit choice-point stack instead of recursion.
+
+        Each open level is a frame holding a cell and the position of its next untried candidate
+        in a shared candidate stack. Placements go on a trail, and returning to a frame pops the
+        trail to restore cell values, domino counts and region aggregates, so the search loop makes
+        no recursive calls and allocates nothing per level beyond the candidate codes themselves.
+        """
+        board = self.board
+        num_tiles = board.num_cells
+        if num_tiles % 2 != 0:
+            return None
+
+        start_time = time.time()
+        domino_kinds, neighbor_tables, cell_kinds = self._compile_feasibility()
+        num_kinds = len(domino_kinds)
+        # Static tables flattened per CSR edge, in the same order as board.neighbor_ids
+        edge_tables = [table for tables in neighbor_tables for table in tables]
+        neighbor_start, neighbor_ids = board.neighbor_start, board.neighbor_ids
+        cell_region = board.cell_region
+        num_regions = len(board.region_types)
+
+        values = [-1] * num_tiles
+        empty_neighbors = [neighbor_start[c + 1] - neighbor_start[c] for c in range(num_tiles)]
+        region_filled = [0] * num_regions
+        region_sums = [0] * num_regions
+        region_counts = [[0] * 7 for _ in range(num_regions)]  # Histogram of placed pip values
+        domino_counts = [0] * num_kinds
+        pip_counts = [0] * 7
+        kind_index = {kind: k for k, kind in enumerate(domino_kinds)}
+        for domino in self.dominoes:
+            v1, v2 = int(domino[0]), int(domino[1])
+            domino_counts[kind_index[(min(v1, v2), max(v1, v2))]] += 1
+            pip_counts[v1] += 1
+            pip_counts[v2] += 1
+        remaining = len(self.dominoes)
+
+        check_region, _, bounds_feasible = _region_checks(self.difficulty_data['regions'], region_filled,
+                                                          region_sums, region_counts, pip_counts)
+
+        def check_constraints(cell, value):
+            """Check if placing value on cell keeps its region satisfiable, in O(1)."""
+            return check_region(cell_region[cell], value)
+
+        def set_value(cell, value):
+            r = cell_region[cell]
+            values[cell] = value
+            region_filled[r] += 1
+            region_sums[r] += value
+            region_counts[r][value] += 1
+            pip_counts[value] -= 1
+            for e in range(neighbor_start[cell], neighbor_start[cell + 1]):
+                empty_neighbors[neighbor_ids[e]] -= 1
+
+        def clear_value(cell):
+            r = cell_region[cell]
+            value = values[cell]
+            values[cell] = -1
+            region_filled[r] -= 1
+            region_sums[r] -= value
+            region_counts[r][value] -= 1
+            pip_counts[value] += 1
+            for e in range(neighbor_start[cell], neighbor_start[cell + 1]):
+                empty_neighbors[neighbor_ids[e]] += 1
+
+        def has_dead_end(cell):
+            """Check if filling cell isolated one of its empty neighbors."""
+            for e in range(neighbor_start[cell], neighbor_start[cell + 1]):
+                n = neighbor_ids[e]
+                if values[n] < 0 and not empty_neighbors[n]:
+                    return True
+            return False
+
+        def find_next_empty():
+            """Find the empty cell with the fewest empty neighbors (MRV)."""
+            best_cell, min_empty_neighbors = -1, 5
+            for cell in range(num_tiles):
+                if values[cell] < 0 and empty_neighbors[cell] < min_empty_neighbors:
+                    best_cell, min_empty_neighbors = cell, empty_neighbors[cell]
+                    if min_empty_neighbors <= 1:
+                        break
+            return best_cell
+
+        # Candidate placements of every open frame, each encoded as (edge * num_kinds + kind) * 2 + orientation
+        candidates = []
+        frame_cells, frame_starts, frame_next = [], [], []
+        trail = []  # (cell, neighbor, kind) of the placement made by each frame
+        stats = self.stats
+        prunes = stats.prunes
+
+        # Scratch buffers reused by every push_frame: a cell has at most 4 edges and num_kinds kinds
+        edge_buffer = [0] * 4
+        kind_buffer = [0] * num_kinds
+        randrange = random.randrange
+
+        def push_frame(cell):
+            """Open a frame for cell and append its candidates in search order."""
+            frame_cells.append(cell)
+            frame_starts.append(len(candidates))
+            frame_next.append(len(candidates))
+            # Edges to empty neighbors, insertion-sorted by how many empty neighbors those have
+            num_edges = 0
+            for e in range(neighbor_start[cell], neighbor_start[cell + 1]):
+                n = neighbor_ids[e]
+                if values[n] < 0:
+                    j = num_edges
+                    while j and empty_neighbors[neighbor_ids[edge_buffer[j - 1]]] > empty_neighbors[n]:
+                        edge_buffer[j] = edge_buffer[j - 1]
+                        j -= 1
+                    edge_buffer[j] = e
+                    num_edges += 1
+            # Kinds still left, in random order (Fisher-Yates)
+            num_to_try = 0
+            for k in cell_kinds[cell]:
+                if domino_counts[k]:
+                    kind_buffer[num_to_try] = k
+                    num_to_try += 1
+            for i in range(num_to_try - 1, 0, -1):
+                j = randrange(i + 1)
+                kind_buffer[i], kind_buffer[j] = kind_buffer[j], kind_buffer[i]
+            for i in range(num_to_try):
+                k = kind_buffer[i]
+                for o in (0, 1):
+                    for j in range(num_edges):
+                        e = edge_buffer[j]
+                        if edge_tables[e][k][o]:
+                            candidates.append((e * num_kinds + k) * 2 + o)
+
+        def try_place(cell, code):
+            """Make the placement a candidate code stands for; False with nothing placed if it fails."""
+            e, rest = divmod(code, num_kinds * 2)
+            k, o = divmod(rest, 2)
+            neighbor = neighbor_ids[e]
+            v1, v2 = domino_kinds[k] if o == 0 else domino_kinds[k][::-1]
+            stats.placements += 1
+            if not check_constraints(cell, v1):
+                prunes['constraint'] += 1
+                return False
+            set_value(cell, v1)
+            if not check_constraints(neighbor, v2):
+                prunes['constraint'] += 1
+                clear_value(cell)
+                return False
+            set_value(neighbor, v2)
+            domino_counts[k] -= 1
+            if has_dead_end(cell) or has_dead_end(neighbor):
+                prunes['dead_end'] += 1
+            elif not bounds_feasible():
+                prunes['bounds'] += 1
+            else:
+                trail.append((cell, neighbor, k))
+                if len(trail) > stats.max_depth:
+                    stats.max_depth = len(trail)
+                return True
+            domino_counts[k] += 1
+            clear_value(neighbor)
+            clear_value(cell)
+            return False
+
+        def undo_placement():
+            cell, neighbor, k = trail.pop()
+            domino_counts[k] += 1
+            clear_value(neighbor)
+            clear_value(cell)
+
+        if any(not empty_neighbors[c] for c in range(num_tiles)) or not bounds_feasible():
+            return False
+        cell = find_next_empty()
+        if cell < 0:
+            return remaining == 0
+        push_frame(cell)
+
+        success = timed_out = False
+        iterations = 0
+        while frame_cells:
+            iterations += 1
+            if iterations % 200 == 0 and (time.time() - start_time > timeout or self._cancelled()):
+                timed_out = True
+                break
+
+            top = len(frame_cells) - 1
+            if len(trail) > top:
+                # Back at this frame after its last placement failed below it
+                undo_placement()
+                remaining += 1
+
+            cell, i, end = frame_cells[top], frame_next[top], len(candidates)
+            while i < end and not try_place(cell, candidates[i]):
+                i += 1
+            if i == end:
+                del candidates[frame_starts[top]:]
+                frame_cells.pop()
+                frame_starts.pop()
+                frame_next.pop()
+                continue
+            frame_next[top] = i + 1
+            remaining -= 1
+
+            cell = find_next_empty()
+            if cell < 0:
+                if remaining == 0:
+                    success = True
+                    break
+                continue
+            push_frame(cell)
+
+        stats.nodes += iterations
+        if timed_out:
+            return None
+        if success:
+            for node, value in zip(self.nodes, values):
+                node.value = value
+        return success
+
+    def _solve_numba(self, timeout):
+        """Single solve attempt with the nopython-compiled search kernel in kernel.py.
+
+        The kernel runs the iterative engine's search on NumPy arrays of the compiled board.
+        Without numba or NumPy this runs the 'iterative' engine instead.
+        """
+        import kernel  # Imported here so that the other engines do not pay for loading numba
+        if not kernel.AVAILABLE:
+            return self._solve_iterative(timeout)
+        if len(self.nodes) % 2 != 0:
+            return None
+
+        start_time = time.time()
+        success, values, steps = kernel.solve(self, random.getrandbits(31),
+                                       lambda: time.time() - start_time > timeout or self._cancelled())
+        self.stats.nodes += steps
+        if success:
+            for node, value in zip(self.nodes, values):
+                node.value = value
+        return success
+
+    def _solve_dlx(self, timeout):
+        """Single solve attempt as an exact-cover problem using dancing links (Algorithm X).
+
+        Columns are the cells and the individual dominoes, rows are placements of one domino in
+        one orientation on two adjacent cells. Region constraints are secondary conditions that
+        are checked, together with the remaining-pip bounds, whenever a row is selected.
+        """
+        num_tiles = len(self.nodes)
+        if num_tiles % 2 != 0:
+            return None
+        if num_tiles != 2 * len(self.dominoes):
+            return False  # Every cell is covered by exactly one domino, so no exact cover exists
+
+        for node in self.nodes:
+            node.value = None
+
+        start_time = time.time()
+        timed_out = [False]
+
+        neighbor_masks, cell_region, region_masks, _, _ = self._compile_bitboard()
+        num_regions = len(region_masks)
+        region_filled = [0] * num_regions
+        region_sums = [0] * num_regions
+        region_counts = [[0] * 7 for _ in range(num_regions)]
+        values = [None] * num_tiles
+
+        dominoes = [(int(d[0]), int(d[1])) for d in self.dominoes]
+        pip_counts = [0] * 7
+        for v1, v2 in dominoes:
+            pip_counts[v1] += 1
+            pip_counts[v2] += 1
+        check_region, _, bounds_feasible = _region_checks(self.difficulty_data['regions'], region_filled,
+                                                          region_sums, region_counts, pip_counts)
+
+        # Identical dominoes must be used in index order, so only the first unused one may be
+        # branched on or placed; otherwise every permutation of twins would be searched.
+        first_twin = {}
+        previous_twin = [None] * len(dominoes)
+        for i, domino in enumerate(dominoes):
+            kind = tuple(sorted(domino))
+            previous_twin[i] = first_twin.get(kind)
+            first_twin[kind] = i
+
+        # One row per domino, orientation and pair of adjacent cells, in random order
+        rows = []
+        for i, (v1, v2) in enumerate(dominoes):
+            orientations = [(v1, v2)] if v1 == v2 else [(v1, v2), (v2, v1)]
+            for a in range(num_tiles):
+                mask = neighbor_masks[a]
+                while mask:
+                    low = mask & -mask
+                    b = low.bit_length() - 1
+                    mask ^= low
+                    if b < a:
+                        continue
+                    for p, q in orientations:
+                        rows.append((a, b, p, q, i))
+        random.shuffle(rows)
+        matrix = DancingLinks(num_tiles + len(dominoes), [[a, b, num_tiles + i] for a, b, _, _, i in rows])
+
+        def twin_ready(i):
+            """Check that every earlier identical domino has already been placed."""
+            prev = previous_twin[i]
+            return prev is None or matrix.is_covered(num_tiles + prev)
+
+        def check_constraints(cell, value):
+            """Check if placing value at cell satisfies its region's constraint."""
+            return check_region(cell_region[cell], value)
+
+        def set_value(cell, value):
+            r = cell_region[cell]
+            values[cell] = value
+            region_filled[r] += 1
+            region_sums[r] += value
+            region_counts[r][value] += 1
+            pip_counts[value] -= 1
+
+        def clear_value(cell):
+            r = cell_region[cell]
+            value = values[cell]
+            values[cell] = None
+            region_filled[r] -= 1
+            region_sums[r] -= value
+            region_counts[r][value] -= 1
+            pip_counts[value] += 1
+
+        stats = self.stats
+        prunes = stats.prunes
+        depth = [0]  # Rows currently selected
+
+        def select(row):
+            a, b, p, q, i = rows[row]
+            if not twin_ready(i):
+                return False
+            stats.placements += 1
+            if not check_constraints(a, p):
+                prunes['constraint'] += 1
+                return False
+            set_value(a, p)
+            if not check_constraints(b, q):
+                prunes['constraint'] += 1
+            else:
+                set_value(b, q)
+                if bounds_feasible():
+                    depth[0] += 1
+                    if depth[0] > stats.max_depth:
+                        stats.max_depth = depth[0]
+                    return True
+                prunes['bounds'] += 1
+                clear_value(b)
+            clear_value(a)
+            return False
+
+        def deselect(row):
+            a, b, _, _, _ = rows[row]
+            depth[0] -= 1
+            clear_value(b)
+            clear_value(a)
+
+        search_calls = [0]
+
+        def should_stop():
+            search_calls[0] += 1
+            if search_calls[0] % 200 == 0 and (time.time() - start_time > timeout or self._cancelled()):
+                timed_out[0] = True
+            return timed_out[0]
+
+        def choosable(col):
+            return col < num_tiles or twin_ready(col - num_tiles)
+
+        if not bounds_feasible():
+            return False
+        solution = matrix.search(select, deselect, should_stop, choosable)
+        stats.nodes += search_calls[0]
+
+        if timed_out[0]:
+            return None
+        if solution is None:
+            return False
+        for node, value in zip(self.nodes, values):
+            node.value = value
+        return True
+
+# ------------------------------------------------------------------------------------------------
+
+class SolverPool:
+    """Long-lived worker processes shared by every puzzle solved with solve(pool=...).
+
+    Each job is a compact serialized board plus the solver options. Workers rebuild the graph,
+    run one seeded attempt and report back. Once a job has a solution (or runs out of time), its
+    remaining attempts are cancelled cooperatively and the workers go back to waiting for jobs.
+    """
+
+    def __init__(self, processes=None):
+        self.processes = processes or min(cpu_count(), 4)
+        self.tasks = Queue()
+        self.results = Queue()
+        self.active_job = Value('i', 0)  # Id of the job workers may keep working on
+        self.job_count = 0
+        # One table for every job; each job salts its hashes, so entries of earlier jobs never match
+        self.nogoods = SharedNogoods()
+        self.workers = []
+        for _ in range(self.processes):
+            p = Process(target=_pool_worker, args=(self.tasks, self.results, self.active_job, self.nogoods), daemon=True)
+            p.start()
+            self.workers.append(p)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def run(self, graph, timeout, max_attempts):
+        """Run up to one attempt per worker on graph and return the first solution found, or None."""
+        self.job_count += 1
+        job_id = self.job_count
+        self.active_job.value = job_id
+
+        board = graph._serialize()
+        options = graph._options()
+        num_attempts = min(max_attempts, self.processes)
+        share = num_attempts > 1 and graph._shares_nogoods()
+        for attempt in range(num_attempts):
+            self.tasks.put((job_id, board, options, attempt, timeout, share))
+
+        deadline = time.time() + timeout
+        solution = None
+        pending = num_attempts
+        while pending and solution is None:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+            try:
+                result_job, attempt, result, result_solution, stats = self.results.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if result_job != job_id:
+                continue  # Late report from a job that was already cancelled
+            pending -= 1
+            graph.stats.merge(stats)
+            if result is True:
+                solution = result_solution
+                graph.stats.worker = attempt
+
+        # Cancel the losing attempts; their workers return to the pool
+        self.active_job.value = 0
+        return solution
+
+    def close(self):
+        self.active_job.value = 0
+        for _ in self.workers:
+            self.tasks.put(None)
+        for p in self.workers:
+            p.join(timeout=1)
+            if p.is_alive():
+                p.terminate()
+        self.workers = []
+        self.nogoods.close()
+
+
+def _pool_worker(tasks, results, active_job, nogoods):
+    """Worker loop for SolverPool: solve attempts until a None task arrives."""
+    for job_id, board, options, attempt, timeout, share in iter(tasks.get, None):
+        if active_job.value != job_id:
+            continue  # Job finished before this attempt was picked up
+        game = None
+        try:
+            game = GraphMultiProcess(board, 'board')
+            game._set_options(options)
+            game.cancel_check = lambda job_id=job_id: active_job.value != job_id
+            if share:
+                game.shared_nogoods = nogoods
+                game.nogood_salt = random.Random(job_id).getrandbits(64)
+            random.seed(attempt * 1000 + len(game.nodes))
+            result = game._run_engine(timeout)
+            solution = {node.p: node.value for node in game.nodes} if result is True else None
+        except Exception:
+            result, solution = False, None
+        results.put((job_id, attempt, result, solution, game.stats if game is not None else SolveStats()))
+
+
+def profile_solve(graph, output='pips_profile.txt', sort='tottime', **solve_kwargs):
+    """Solve graph in this process under cProfile and write the profile to output.
+    
+    The solve runs on the sequential path, so the search is profiled instead of the wait for
+    child processes. The engines' closures (check_constraints, find_next_empty, has_dead_end,
+    place_domino, ...) show up as separate entries.
+    
+    Args:
+        graph: GraphMultiProcess to solve
+        output: Path of the text report, or of a binary pstats dump if it ends in '.prof'
+        sort: pstats sort key for the text report (default: 'tottime')
+        **solve_kwargs: Further arguments for solve()
+        
+    Returns:
+        The result of solve()
+    """
+    profiler = cProfile.Profile()
+    result = profiler.runcall(graph.solve, use_parallel=False, **solve_kwargs)
+    write_profile(profiler, output, sort)
+    return result
+
+
+def write_profile(profiler, output, sort='tottime'):
+    """Write a cProfile.Profile as a text report, or as a pstats dump if output ends in '.prof'."""
+    if output.endswith('.prof'):
+        profiler.dump_stats(output)
+        return
+    with open(output, 'w') as f:
+        pstats.Stats(profiler, stream=f).strip_dirs().sort_stats(sort).print_stats()
+
 # ------------------------------------------------------------------------------------------------
 
 if __name__ == '__main__':
-    date = sys.argv[1] if len(sys.argv) > 1 else '2025-10-02'
-    difficulty = sys.argv[2] if len(sys.argv) > 2 else 'easy'
+    parser = argparse.ArgumentParser(description='Solve one puzzle from boards_json.')
+    parser.add_argument('date', nargs='?', default='2025-10-02')
+    parser.add_argument('difficulty', nargs='?', default='easy', choices=['easy', 'medium', 'hard'])
+    parser.add_argument('engine', nargs='?', default='backtrack', choices=list(GraphMultiProcess.ENGINES))
+    parser.add_argument('--profile', action='store_true', help='profile the solve on the sequential path')
+    parser.add_argument('--profile-output', default='pips_profile.txt', help="profile report; a '.prof' file gets raw pstats data")
+    args = parser.parse_args()
+    date, difficulty, engine = args.date, args.difficulty, args.engine
+    profile_output = args.profile_output if args.profile else None
     with open(f'boards_json/{date}.json', 'r') as f:
         data = json.load(f)
 
@@ -428,8 +2442,13 @@ if __name__ == '__main__':
     G.visualize()
     print(f"Dominoes to place: {G.dominoes}\n")
     
-    G.solve()
+    if profile_output:
+        profile_solve(G, profile_output, engine=engine)
+        print(f"Profile written to {profile_output}")
+    else:
+        G.solve(engine=engine)
     
     print("\nSolved board:")
     G.visualize()
+    print(G.stats)
     
\ No newline at end of file
@@ -1,21 +1,36 @@
-from pips_solver import GraphMultiProcess
+from pips_solver import GraphMultiProcess, SolverPool, profile_solve, write_profile
+from solution_cache import SolutionCache
 import time
-import os, json
+import argparse, os, json, cProfile, traceback
+from collections import deque
+from multiprocessing import Pipe, Process, cpu_count
+from multiprocessing.connection import wait
 from tqdm import tqdm
-from numba import jit, cuda
 
 DIFFICULTIES = ['easy', 'medium', 'hard']
 
-def run_solver_all_GPU(timeout_limit = 15) -> None:
+
+def run_solver_all(timeout_limit = 15, engine: str = 'backtrack', cache_path = None) -> float:
     total_time: float = 0.0
     for difficulty in DIFFICULTIES:
-        total_time += run_solver_GPU(difficulty, timeout_limit)
+        total_time += run_solver(difficulty, timeout_limit, engine, cache_path)
     print('------------------------')
     print('------------------------')
     print(f'TOTAL TIME: {round(total_time, 3)} seconds')
+    return total_time
+
 
+def compare_engines(engines = ('backtrack', 'dlx'), timeout_limit = 15) -> None:
+    totals = {}
+    for engine in engines:
+        print(f'\n======== Engine: {engine} ========')
+        totals[engine] = run_solver_all(timeout_limit, engine)
+    print('\n------------------------')
+    for engine, total_time in totals.items():
+        print(f'{engine}: {round(total_time, 3)} seconds')
 
-def run_solver_GPU(difficulty: str = 'easy', timeout_limit = 15) -> float:
+
+def run_solver(difficulty: str = 'easy', timeout_limit = 15, engine: str = 'backtrack', cache_path = None) -> float:
     s = time.time()
     matching_solutions = 0
     total_boards = 0
@@ -23,20 +38,24 @@ def run_solver_GPU(difficulty: str = 'easy', timeout_limit = 15) -> float:
     timeout_boards = 0
     timeout_limit = timeout_limit
     print('\n------------------------')
-    print(f'Difficulty: {difficulty}, Timeout: {timeout_limit}s')
-    for file in os.listdir('boards_json'):
-        if file.endswith('.json'):
-            total_boards += 1
-            data = json.load(open(f'boards_json/{file}'))
-            game = GraphMultiProcessGPU(data, difficulty)
-            isSolved = game.solve(timeout=timeout_limit)
-            if isSolved is True:
-                matching_solutions += 1
-            elif isSolved is False:
-                no_solution_boards += 1
-            else:  # isSolved is None (timeout)
-                print(f'Timeout on puzzle {file}\n')
-                timeout_boards += 1
+    print(f'Difficulty: {difficulty}, Timeout: {timeout_limit}s, Engine: {engine}')
+    cache = SolutionCache(cache_path) if cache_path else None
+    with SolverPool() as pool:
+        for file in tqdm(os.listdir('boards_json')):
+            if file.endswith('.json'):
+                total_boards += 1
+                data = json.load(open(f'boards_json/{file}'))
+                game = GraphMultiProcess(data, difficulty)
+                isSolved = game.solve(timeout=timeout_limit, engine=engine, pool=pool, cache=cache)
+                if isSolved is True:
+                    matching_solutions += 1
+                elif isSolved is False:
+                    no_solution_boards += 1
+                else:  # isSolved is None (timeout)
+                    print(f'Timeout on puzzle {file}\n')
+                    timeout_boards += 1
+    if cache is not None:
+        cache.close()
     e = time.time()
     print(f'Time taken: {round(e - s, 3)} seconds')
     avg = (e - s) / total_boards
@@ -46,46 +65,143 @@ def run_solver_GPU(difficulty: str = 'easy', timeout_limit = 15) -> float:
     print(f'[🕛] {timeout_boards} / {total_boards} timed out (>{timeout_limit}s)')
     return e - s
 
+def _solve_job(job) -> tuple:
+    file, difficulty, timeout_limit, engine = job
+    s = time.time()
+    try:
+        data = json.load(open(f'boards_json/{file}'))
+        game = GraphMultiProcess(data, difficulty)
+        isSolved = game.solve(timeout=timeout_limit, use_parallel=False, engine=engine)
+    except Exception:
+        return file, difficulty, None, time.time() - s, traceback.format_exc(limit=3)
+    return file, difficulty, isSolved, time.time() - s, None
 
-def run_solver_all(timeout_limit = 15) -> None:
-    total_time: float = 0.0
-    for difficulty in DIFFICULTIES:
-        total_time += run_solver(difficulty, timeout_limit)
-    print('------------------------')
-    print('------------------------')
-    print(f'TOTAL TIME: {round(total_time, 3)} seconds')
 
+def _run_job(job, conn) -> None:
+    conn.send(_solve_job(job))
+    conn.close()
+
+
+def iter_solver_batch(difficulties = DIFFICULTIES, timeout_limit = 15, processes = None, engine: str = 'backtrack', grace = 5):
+    """Solve every (board, difficulty) pair across worker processes, yielding results as they finish.
+
+    Each job solves one puzzle sequentially with its own timeout, so every core stays busy
+    even on easy and medium boards where per-puzzle parallelism barely helps. Every job runs in
+    its own process, which is terminated if it is still running grace seconds after its
+    timeout, so a puzzle that ignores its timeout cannot hold up the batch.
+    Yields (file, difficulty, isSolved, seconds, error), where error is None or the traceback of
+    an exception raised while solving (isSolved is then None).
+    """
+    files = sorted(f for f in os.listdir('boards_json') if f.endswith('.json'))
+    # Hard puzzles first, so the longest jobs do not end up at the tail of the run
+    jobs = deque((file, difficulty, timeout_limit, engine) for difficulty in reversed(difficulties) for file in files)
+    processes = processes or cpu_count()
+    running = {}  # Result pipe -> (process, job, start time)
+    try:
+        while jobs or running:
+            while jobs and len(running) < processes:
+                job = jobs.popleft()
+                recv, send = Pipe(duplex=False)
+                p = Process(target=_run_job, args=(job, send), daemon=True)
+                p.start()
+                send.close()
+                running[recv] = (p, job, time.time())
+            
+            next_deadline = min(start for _, _, start in running.values()) + timeout_limit + grace
+            for conn in wait(list(running), timeout=max(next_deadline - time.time(), 0)):
+                p, (file, difficulty, _, _), start = running.pop(conn)
+                try:
+                    result = conn.recv()
+                except EOFError:  # The worker died without reporting back
+                    result = (file, difficulty, None, time.time() - start, f'worker exited with code {p.exitcode}')
+                conn.close()
+                p.join()
+                yield result
+            
+            now = time.time()
+            for conn, (p, (file, difficulty, _, _), start) in list(running.items()):
+                if now - start > timeout_limit + grace:
+                    # Past the hard deadline: the job counts as timed out
+                    p.terminate()
+                    p.join()
+                    conn.close()
+                    del running[conn]
+                    yield file, difficulty, None, now - start, None
+    finally:
+        for p, _, _ in running.values():
+            p.terminate()
 
-def run_solver(difficulty: str = 'easy', timeout_limit = 15) -> float:
+
+def run_solver_batch(difficulties = DIFFICULTIES, timeout_limit = 15, processes = None, engine: str = 'backtrack') -> float:
     s = time.time()
-    matching_solutions = 0
-    total_boards = 0
-    no_solution_boards = 0
-    timeout_boards = 0
-    timeout_limit = timeout_limit
+    counts = {difficulty: {'solved': 0, 'no_solution': 0, 'timeout': 0, 'error': 0, 'time': 0.0} for difficulty in difficulties}
     print('\n------------------------')
-    print(f'Difficulty: {difficulty}, Timeout: {timeout_limit}s')
-    for file in tqdm(os.listdir('boards_json')):
-        if file.endswith('.json'):
-            total_boards += 1
-            data = json.load(open(f'boards_json/{file}'))
-            game = GraphMultiProcess(data, difficulty)
-            isSolved = game.solve(timeout=timeout_limit)
-            if isSolved is True:
-                matching_solutions += 1
-            elif isSolved is False:
-                no_solution_boards += 1
-            else:  # isSolved is None (timeout)
-                print(f'Timeout on puzzle {file}\n')
-                timeout_boards += 1
+    print(f'Batch: {", ".join(difficulties)}, Timeout: {timeout_limit}s, Engine: {engine}')
+    total_jobs = len([f for f in os.listdir('boards_json') if f.endswith('.json')]) * len(difficulties)
+    for file, difficulty, isSolved, seconds, error in tqdm(iter_solver_batch(difficulties, timeout_limit, processes, engine), total=total_jobs):
+        counts[difficulty]['time'] += seconds
+        if error is not None:
+            tqdm.write(f'Error on puzzle {file} ({difficulty}):\n{error}')
+            counts[difficulty]['error'] += 1
+        elif isSolved is True:
+            counts[difficulty]['solved'] += 1
+        elif isSolved is False:
+            counts[difficulty]['no_solution'] += 1
+        else:  # isSolved is None (timeout)
+            tqdm.write(f'Timeout on puzzle {file} ({difficulty})')
+            counts[difficulty]['timeout'] += 1
     e = time.time()
-    print(f'Time taken: {round(e - s, 3)} seconds')
-    avg = (e - s) / total_boards
-    print(f'Average time/puzzle: {round(avg, 3)} seconds')
-    print(f'[✅] {matching_solutions} / {total_boards} matching solutions')
-    print(f'[❌] {no_solution_boards} / {total_boards} no solution boards')
-    print(f'[🕛] {timeout_boards} / {total_boards} timed out (>{timeout_limit}s)')
+    for difficulty, c in counts.items():
+        total_boards = c['solved'] + c['no_solution'] + c['timeout'] + c['error']
+        print('------------------------')
+        print(f'Difficulty: {difficulty}, Time solving: {round(c["time"], 3)} seconds')
+        print(f'[✅] {c["solved"]} / {total_boards} matching solutions')
+        print(f'[❌] {c["no_solution"]} / {total_boards} no solution boards')
+        print(f'[🕛] {c["timeout"]} / {total_boards} timed out (>{timeout_limit}s)')
+        print(f'[💥] {c["error"]} / {total_boards} raised an error')
+    print('------------------------')
+    print(f'TOTAL TIME: {round(e - s, 3)} seconds')
     return e - s
 
+
+def profile_solver(date: str, difficulty: str = 'hard', timeout_limit = 15, engine: str = 'backtrack', output: str = 'pips_profile.txt'):
+    """Profile a single (date, difficulty) solve in this process and write the report to output."""
+    data = json.load(open(f'boards_json/{date}.json'))
+    game = GraphMultiProcess(data, difficulty)
+    isSolved = profile_solve(game, output, timeout=timeout_limit, engine=engine)
+    print(f'{date} {difficulty}: {isSolved}, {game.stats}')
+    print(f'Profile written to {output}')
+    return isSolved
+
+
+def profile_corpus(difficulties = DIFFICULTIES, timeout_limit = 15, engine: str = 'backtrack', output: str = 'pips_profile.txt') -> None:
+    """Profile sequential solves of every board in boards_json and write one aggregated report to output."""
+    profiler = cProfile.Profile()
+    files = sorted(f for f in os.listdir('boards_json') if f.endswith('.json'))
+    for difficulty in difficulties:
+        for file in tqdm(files, desc=difficulty):
+            data = json.load(open(f'boards_json/{file}'))
+            game = GraphMultiProcess(data, difficulty)
+            isSolved = profiler.runcall(game.solve, timeout=timeout_limit, use_parallel=False, engine=engine)
+            if isSolved is not True:
+                tqdm.write(f'{file} ({difficulty}): {isSolved}')
+    write_profile(profiler, output)
+    print(f'Profile written to {output}')
+
+
 if __name__ == '__main__':
-    run_solver_all(15)
\ No newline at end of file
+    parser = argparse.ArgumentParser(description='Time the solver on every board in boards_json.')
+    parser.add_argument('engine', nargs='?', default='backtrack', choices=list(GraphMultiProcess.ENGINES))
+    parser.add_argument('--profile', action='store_true', help='profile sequential solves of the whole corpus')
+    parser.add_argument('--profile-output', default='pips_profile.txt', help="profile report; a '.prof' file gets raw pstats data")
+    args = parser.parse_args()
+    engine = args.engine
+    profile_output = args.profile_output if args.profile else None
+    if engine == 'numba':
+        import kernel
+        if not kernel.AVAILABLE:
+            print('numba is not installed, the numba engine runs as the iterative engine')
+    if profile_output:
+        profile_corpus(DIFFICULTIES, 15, engine, profile_output)
+    else:
+        run_solver_all(15, engine)
@@ -0,0 +1,58 @@
+from multiprocessing import shared_memory
+
+"""
+Table of dead search-state hashes in shared memory, used by GraphMultiProcess to let parallel workers
+skip states another worker has already proven to have no solution.
+Every slot holds one 64-bit Zobrist hash and a hash can only live in the slot it maps to, so reads and
+writes are single aligned 8-byte accesses with no lock. A newer hash simply overwrites an older one in
+the same slot, which only loses information, never adds a wrong entry.
+"""
+
+# Marks an empty slot; a state whose hash happens to be 0 is never shared
+EMPTY = 0
+
+
+class SharedNogoods:
+    """Fixed-size, lock-free set of 64-bit state hashes shared by processes of one puzzle."""
+
+    def __init__(self, slots=1 << 18, name=None):
+        """Create a zeroed table, or attach to the existing one called name.
+
+        Args:
+            slots: Number of 8-byte slots, a power of two (default: 2^18, 2 MiB)
+            name: Name of the shared memory block to attach to (default: create a new one)
+        """
+        if slots & (slots - 1):
+            raise ValueError(f"slots must be a power of two, got {slots}")
+        self.slots = slots
+        self.owner = name is None
+        self.shm = shared_memory.SharedMemory(name=name, create=self.owner, size=slots * 8)
+        # A new block starts zeroed, i.e. with every slot empty
+        self.table = self.shm.buf[:slots * 8].cast('Q')
+        self.mask = slots - 1
+
+    def __reduce__(self):
+        # Pickled by name, so workers started with spawn or sent the table over a queue attach to it
+        return SharedNogoods, (self.slots, self.shm.name)
+
+    def __contains__(self, key):
+        return key != EMPTY and self.table[key & self.mask] == key
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def add(self, key):
+        self.table[key & self.mask] = key
+
+    def close(self):
+        """Detach from the table; the process that created it also frees it."""
+        if self.table is None:
+            return
+        self.table.release()
+        self.table = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
@@ -0,0 +1,97 @@
+import hashlib, json, sqlite3, time
+
+"""
+On-disk cache of solved puzzles, used by GraphMultiProcess.solve(cache=...).
+Puzzles are keyed by a canonical fingerprint of their regions, constraints and domino multiset that
+ignores translation and the 8 symmetries of the grid, so a board that is only a reflection or rotation
+of a cached one is answered without searching.
+"""
+
+# (swap row/col, row sign, col sign) for the 8 symmetries of the square grid
+SYMMETRIES = [(swap, sr, sc) for swap in (False, True) for sr in (1, -1) for sc in (1, -1)]
+
+
+def _transform(p, symmetry):
+    swap, sr, sc = symmetry
+    r, c = (p[1], p[0]) if swap else (p[0], p[1])
+    return sr * r, sc * c
+
+
+def fingerprint(regions, dominoes):
+    """Canonical key of a puzzle and a function mapping its cells to canonical coordinates.
+
+    Args:
+        regions: Region definitions as in the JSON ('indices', 'type', optional 'target')
+        dominoes: List of [a, b] dominoes
+
+    Returns:
+        (key, to_canonical) where key is a hex digest and to_canonical maps a cell position
+        to its (row, col) in the canonical orientation
+    """
+    domino_form = sorted(sorted(int(v) for v in d) for d in dominoes)
+    best = None
+    for symmetry in SYMMETRIES:
+        moved = [[_transform(p, symmetry) for p in region['indices']] for region in regions]
+        row0 = min(p[0] for cells in moved for p in cells)
+        col0 = min(p[1] for cells in moved for p in cells)
+        region_form = sorted(json.dumps([region.get('type'), region.get('target'),
+                                         sorted([p[0] - row0, p[1] - col0] for p in cells)])
+                             for region, cells in zip(regions, moved))
+        form = json.dumps([region_form, domino_form])
+        if best is None or form < best[0]:
+            best = (form, symmetry, row0, col0)
+
+    form, symmetry, row0, col0 = best
+
+    def to_canonical(p):
+        r, c = _transform(p, symmetry)
+        return r - row0, c - col0
+
+    return hashlib.sha256(form.encode()).hexdigest(), to_canonical
+
+
+class SolutionCache:
+    """Size-bounded SQLite store of solutions, evicting the least recently used entries."""
+
+    def __init__(self, path='.pips_cache.sqlite3', max_entries=10000):
+        self.path = path
+        self.max_entries = max_entries
+        self.db = sqlite3.connect(path)
+        self.db.execute('CREATE TABLE IF NOT EXISTS solutions (key TEXT PRIMARY KEY, solution TEXT, last_used REAL)')
+        self.db.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self.db.execute('SELECT COUNT(*) FROM solutions').fetchone()[0]
+
+    def get(self, regions, dominoes):
+        """Return the cached solution as {cell position tuple: pip value}, or None on a miss."""
+        key, to_canonical = fingerprint(regions, dominoes)
+        row = self.db.execute('SELECT solution FROM solutions WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            return None
+        self.db.execute('UPDATE solutions SET last_used = ? WHERE key = ?', (time.time(), key))
+        self.db.commit()
+        values = {(r, c): v for r, c, v in json.loads(row[0])}
+        return {tuple(p): values[to_canonical(p)] for region in regions for p in region['indices']}
+
+    def put(self, regions, dominoes, solution):
+        """Store a solution given as {cell position tuple: pip value}."""
+        key, to_canonical = fingerprint(regions, dominoes)
+        canonical = sorted([*to_canonical(p), v] for p, v in solution.items())
+        self.db.execute('INSERT OR REPLACE INTO solutions VALUES (?, ?, ?)', (key, json.dumps(canonical), time.time()))
+        self.db.execute('DELETE FROM solutions WHERE key NOT IN '
+                        '(SELECT key FROM solutions ORDER BY last_used DESC LIMIT ?)', (self.max_entries,))
+        self.db.commit()
+
+    def clear(self):
+        self.db.execute('DELETE FROM solutions')
+        self.db.commit()
+
+    def close(self):
+        self.db.close()